@@ -9,7 +9,7 @@ Creates Go and Python RPC clients and servers dynamically based on
 matrix parameters. Handles certificate configuration and process management."""
 
 import asyncio
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable
 from contextlib import asynccontextmanager
 import os
 from pathlib import Path
@@ -26,6 +26,46 @@ from .cert_manager import CertificateManager
 from .matrix_config import CryptoConfig
 
 
+def is_handshake_line(line: str) -> bool:
+    """Return True for a go-plugin handshake line (core|protocol|network|address|protocol|cert)."""
+    return "|tcp|" in line or "|unix|" in line
+
+
+async def wait_for_stdout_line(
+    process: subprocess.Popen, predicate: Callable[[str], bool], timeout: float
+) -> str:
+    """Return the first stdout line of `process` that matches `predicate`, stripped.
+
+    Lines are read in a worker thread, so this returns as soon as the server writes the
+    line instead of polling on a fixed interval. On timeout the process is killed, which
+    also unblocks the reader thread with EOF.
+
+    Raises:
+        RuntimeError: If the process closes stdout (exits) before printing a matching line.
+        TimeoutError: If no matching line appears within `timeout` seconds.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while True:
+        try:
+            line = await asyncio.wait_for(asyncio.to_thread(process.stdout.readline), deadline - loop.time())
+        except TimeoutError:
+            process.kill()
+            await asyncio.to_thread(process.wait)
+            raise TimeoutError(
+                f"Server process not ready after {timeout}s. Stderr: {_stderr_tail(process)}"
+            ) from None
+        if predicate(line):
+            return line.strip()
+        if not line:
+            raise RuntimeError(f"Server process exited before it was ready. Stderr: {_stderr_tail(process)}")
+
+
+def _stderr_tail(process: subprocess.Popen, limit: int = 2000) -> str:
+    """Read the rest of an exited process's stderr and return its last `limit` characters."""
+    return process.stderr.read()[-limit:] if process.stderr else ""
+
+
 class ReferenceKVServer:
     """Base class for KV server implementations."""
 
@@ -108,20 +148,13 @@ class GoKVServer(ReferenceKVServer):
             args, env=env, cwd=self.work_dir, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
         )
 
-        # Wait for server to start and parse address from stdout
-        # The soup-go server-start command prints the address to stdout
-        server_started = False
-        while not server_started:
-            line = self.process.stdout.readline()
-            if "Server listening on" in line:
-                self.address = line.split("Server listening on ")[1].strip()
-                self.server_port = int(self.address.split(":")[-1])
-                server_started = True
-            elif self.process.poll() is not None:
-                # Process exited before printing address, something went wrong
-                stdout, stderr = self.process.communicate()
-                raise RuntimeError(f"Go server failed to start. Stdout: {stdout}, Stderr: {stderr}")
-            await asyncio.sleep(0.1)  # Avoid busy-waiting
+        # The soup-go server-start command prints the address to stdout once it is listening
+        try:
+            line = await wait_for_stdout_line(self.process, lambda line: "Server listening on" in line, 30.0)
+        except (RuntimeError, TimeoutError) as e:
+            raise RuntimeError(f"Go server failed to start. {e}") from e
+        self.address = line.split("Server listening on ")[1].strip()
+        self.server_port = int(self.address.split(":")[-1])
 
         logger.info(f"Go KV server started at {self.address}")
 
@@ -139,8 +172,8 @@ class GoKVServer(ReferenceKVServer):
 
     async def _wait_for_process(self) -> None:
         """Wait for process to terminate in async context."""
-        while self.process and self.process.poll() is None:
-            await asyncio.sleep(0.1)
+        if self.process:
+            await asyncio.to_thread(self.process.wait)
 
 
 class PythonKVServer(ReferenceKVServer):
@@ -222,8 +255,8 @@ class PythonKVServer(ReferenceKVServer):
 
     async def _wait_for_process(self) -> None:
         """Wait for process to terminate in async context."""
-        while self.process and self.process.poll() is None:
-            await asyncio.sleep(0.1)
+        if self.process:
+            await asyncio.to_thread(self.process.wait)
 
 
 class ReferenceKVClient:
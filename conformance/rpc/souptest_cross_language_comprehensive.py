@@ -19,11 +19,12 @@ import os
 from pathlib import Path
 import shutil
 import subprocess  # nosec
-import time
 
 from provide.foundation import logger
 import pytest
 
+from .harness_factory import is_handshake_line, wait_for_stdout_line
+
 
 @pytest.fixture
 def soup_go_path() -> Path | None:
@@ -165,32 +166,11 @@ async def test_go_to_python(
     # Handshake format: core_version|protocol_version|network|address|protocol|cert
     # Example: 1|1|tcp|127.0.0.1:54321|grpc|CERT_BASE64
     logger.info("⏳ Waiting for Python server handshake...")
-    handshake_line = ""
-    timeout_seconds = 30
-    start_time = time.time()
-    while time.time() - start_time < timeout_seconds:
-        line = server_process.stdout.readline()
-        if line:
-            # Look for the go-plugin handshake pattern: starts with "1|1|tcp|" or "1|1|unix|"
-            if (
-                line.startswith("1|1|tcp|")
-                or line.startswith("1|1|unix|")
-                or "|tcp|" in line
-                or "|unix|" in line
-            ):
-                handshake_line = line.strip()
-                break
-        else:
-            # If no line, give the server a moment to produce output
-            await asyncio.sleep(0.1)
-
-        # Check if the process has terminated prematurely
-        if server_process.poll() is not None:
-            stderr_output = server_process.stderr.read()
-            logger.error(f"❌ Server terminated prematurely! Stderr: {stderr_output}")
-            raise AssertionError(f"Server process terminated prematurely. Stderr: {stderr_output}")
-
-    assert handshake_line, "Python server did not output handshake line"
+    try:
+        handshake_line = await wait_for_stdout_line(server_process, is_handshake_line, 30.0)
+    except (RuntimeError, TimeoutError) as e:
+        logger.error(f"❌ Python server did not output handshake line! {e}")
+        raise AssertionError(f"Python server did not output handshake line. {e}") from e
 
     # Verify handshake format
     parts = handshake_line.split("|")
@@ -293,7 +273,6 @@ async def test_go_to_go(soup_go_path: Path | None, test_artifacts_dir: Path) ->
     """
     import os
     import subprocess  # nosec
-    import time
 
     if soup_go_path is None:
         pytest.skip("soup-go executable not found")
@@ -319,23 +298,10 @@ async def test_go_to_go(soup_go_path: Path | None, test_artifacts_dir: Path) ->
     )
 
     # Wait for handshake
-    handshake_line = ""
-    timeout_seconds = 10
-    start_time = time.time()
-    while time.time() - start_time < timeout_seconds:
-        line = server_process.stdout.readline()
-        if line and (
-            line.startswith("1|1|tcp|") or line.startswith("1|1|unix|") or "|tcp|" in line or "|unix|" in line
-        ):
-            handshake_line = line.strip()
-            break
-        await asyncio.sleep(0.1)
-
-        if server_process.poll() is not None:
-            stderr_output = server_process.stderr.read()
-            raise AssertionError(f"Go server terminated prematurely. Stderr: {stderr_output}")
-
-    assert handshake_line, "Go server did not output handshake"
+    try:
+        handshake_line = await wait_for_stdout_line(server_process, is_handshake_line, 10.0)
+    except (RuntimeError, TimeoutError) as e:
+        raise AssertionError(f"Go server did not output handshake. {e}") from e
 
     try:
         # 2. PUT using Go client
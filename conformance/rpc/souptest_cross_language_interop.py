@@ -19,7 +19,6 @@ import asyncio
 import os
 from pathlib import Path
 import subprocess  # nosec
-import time
 
 import grpc.aio
 from provide.foundation import logger
@@ -28,6 +27,8 @@ import pytest
 from tofusoup.rpc.client import KVClient
 from tofusoup.rpc.server import serve
 
+from .harness_factory import is_handshake_line, wait_for_stdout_line
+
 
 @pytest.fixture
 def soup_path() -> Path | None:
@@ -188,30 +189,10 @@ class TestCrossLanguageInterop:
         )
 
         # Wait for the server to start and output its handshake
-        handshake_line = ""
-        timeout_seconds = 30
-        start_time = time.time()
-        while time.time() - start_time < timeout_seconds:
-            line = server_process.stdout.readline()
-            if line:
-                # Look for the go-plugin handshake pattern: starts with "1|1|tcp|" or "1|1|unix|"
-                if (
-                    line.startswith("1|1|tcp|")
-                    or line.startswith("1|1|unix|")
-                    or "|tcp|" in line
-                    or "|unix|" in line
-                ):
-                    handshake_line = line.strip()
-                    break
-            else:
-                # If no line, give the server a moment to produce output
-                await asyncio.sleep(0.1)
-
-            # Check if the process has terminated prematurely
-            if server_process.poll() is not None:
-                stderr_output = server_process.stderr.read()
-                raise AssertionError(f"Server process terminated prematurely. Stderr: {stderr_output}")
-        assert handshake_line, "Python server did not output handshake line"
+        try:
+            handshake_line = await wait_for_stdout_line(server_process, is_handshake_line, 30.0)
+        except (RuntimeError, TimeoutError) as e:
+            raise AssertionError(f"Python server did not output handshake line. {e}") from e
 
         # Extract port from handshake line
         parts = handshake_line.split("|")
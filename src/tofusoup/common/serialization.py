@@ -5,6 +5,7 @@
 
 """Generic serialization and deserialization utilities for JSON and Msgpack."""
 
+from collections.abc import Callable
 import decimal  # For loading JSON with Decimal
 import json
 from typing import Any  # For type hinting
@@ -14,6 +15,41 @@ import msgpack  # type: ignore[import-untyped]
 # from lark.exceptions import LarkError # Not used in this generic serialization module
 from .exceptions import ConversionError
 
+# Optional orjson acceleration - graceful fallback to the stdlib json module
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def fast_json_loads(data: bytes | bytearray | str) -> Any:
+    """Parse JSON from bytes or str, using orjson when it is installed.
+
+    Accepting bytes lets callers skip a UTF-8 decode of subprocess output. Both
+    backends raise a json.JSONDecodeError subclass on invalid input.
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def fast_json_dumps(data: Any, *, indent: bool = False, default: Callable[[Any], Any] | None = None) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when it is installed.
+
+    With indent=True the output is indented by two spaces, matching json.dumps(indent=2).
+    Non-string dict keys are stringified as the stdlib json module does, and `default`
+    converts otherwise unserializable objects (including dataclasses) for both backends.
+    """
+    if HAS_ORJSON:
+        # Dataclasses go through `default` as with json, rather than orjson's native field dump
+        option = (
+            orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS | (orjson.OPT_INDENT_2 if indent else 0)
+        )
+        return orjson.dumps(data, default=default, option=option)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False, default=default).encode("utf-8")
+
 
 # --- Generic Loader Functions for Python dicts/lists ---
 def load_json_to_python(filepath: str) -> Any:
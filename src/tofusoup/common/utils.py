@@ -79,6 +79,11 @@ def calculate_sha256(filepath: pathlib.Path) -> str:
     return sha256_hash.hexdigest()
 
 
+def decode_output(data: bytes | bytearray) -> str:
+    """Decode captured subprocess output, tolerating invalid UTF-8 and skipping empty buffers."""
+    return data.decode("utf-8", "replace") if data else ""
+
+
 # convert_cty_value_to_plain_python was here, now consolidated into tofusoup.cty.logic
 
 
@@ -15,7 +15,10 @@ REQUEST_TIMEOUT = 5.0
 # Test configuration
 TEST_TIMEOUT_SECONDS = 300
 MATRIX_TIMEOUT_MINUTES = 30
+# Each matrix job is a full `soup stir` run that already fans out one terraform process per
+# test, so matrix parallelism stays small rather than scaling with cores like I/O-bound pools
 MATRIX_PARALLEL_JOBS = 4
+MATRIX_MAX_OUTPUT_BYTES = 256 << 20  # Per stream, per matrix stir run
 STIR_TEST_SECRET = "stir-test-secret"
 
 # Logging
@@ -41,11 +44,14 @@ DEFAULT_CLIENT_LANGUAGE = "python"
 # Environment variables
 ENV_TOFUSOUP_LOG_LEVEL = "TOFUSOUP_LOG_LEVEL"
 ENV_TOFUSOUP_TEST_TIMEOUT = "TOFUSOUP_TEST_TIMEOUT"
+ENV_TOFUSOUP_UVLOOP = "TOFUSOUP_UVLOOP"
+ENV_TOFUSOUP_MATRIX_PARALLEL = "TOFUSOUP_MATRIX_PARALLEL"
 ENV_TF_LOG = "TF_LOG"
 ENV_TF_DATA_DIR = "TF_DATA_DIR"
 ENV_WORKENV_PROFILE = "WORKENV_PROFILE"
 ENV_PYVIDER_PRIVATE_STATE_SHARED_SECRET = "PYVIDER_PRIVATE_STATE_SHARED_SECRET"
 ENV_KV_STORAGE_DIR = "KV_STORAGE_DIR"
+ENV_SOUP_NO_CACHE = "SOUP_NO_CACHE"
 
 # GRPC environment variables
 ENV_GRPC_DEFAULT_CLIENT_CERTIFICATE_PATH = "GRPC_DEFAULT_CLIENT_CERTIFICATE_PATH"
@@ -5,44 +5,47 @@
 
 
 import asyncio
+from collections.abc import Sequence
 from pathlib import Path
 import sys
-from time import monotonic
+from time import perf_counter_ns
 
 import click
 
 from tofusoup.stir.config import MAX_CONCURRENT_TESTS, STIR_PLUGIN_CACHE_DIR
 from tofusoup.stir.discovery import TestDiscovery, TestFilter
 from tofusoup.stir.display import console
-from tofusoup.stir.executor import execute_tests, initialize_tests
+from tofusoup.stir.executor import execute_tests, initialize_tests, run_coroutine
 from tofusoup.stir.models import TestResult
 from tofusoup.stir.reporting import print_failure_report, print_summary_panel
 from tofusoup.stir.runtime import StirRuntime
 
 
-def process_results(results: list[TestResult | BaseException]) -> tuple[list[TestResult], int, bool]:
-    """Process test results and return failure analysis."""
-    failed_tests = []
-    skipped_count = 0
-    all_passed = True
+def process_results(results: Sequence[TestResult | BaseException]) -> tuple[list[TestResult], int, bool]:
+    """Process test results and return failure analysis.
 
-    for res in results:
-        if isinstance(res, TestResult):  # type: ignore[misc]
-            if res.skipped:
-                skipped_count += 1
-            elif not res.success:
-                all_passed = False
-                failed_tests.append(res)
-        elif res and not isinstance(res, asyncio.CancelledError):
-            all_passed = False
-            console.print(f"[bold red]CRITICAL ERROR in test runner:[/bold red] {res}")
+    The common all-passing case is resolved with comprehensions and returns without
+    touching the console; critical runner errors are only reported when present.
+    """
+    test_results = [r for r in results if isinstance(r, TestResult)]
+    skipped_count = sum(1 for r in test_results if r.skipped)
+    failed_tests = [r for r in test_results if not r.skipped and not r.success]
+
+    if len(test_results) == len(results) and not failed_tests:
+        return failed_tests, skipped_count, True
+
+    critical_errors = [
+        r for r in results if not isinstance(r, TestResult) and r and not isinstance(r, asyncio.CancelledError)
+    ]
+    for error in critical_errors:
+        console.print(f"[bold red]CRITICAL ERROR in test runner:[/bold red] {error}")
 
     if failed_tests:
         console.print("\n[bold red]📊 Failure Analysis:[/bold red]")
         for failure in failed_tests:
             print_failure_report(failure)
 
-    return failed_tests, skipped_count, all_passed
+    return failed_tests, skipped_count, not failed_tests and not critical_errors
 
 
 async def main(
@@ -54,6 +57,7 @@ async def main(
     tags: list[str] | None = None,
     types: list[str] | None = None,
     regex_pattern: str | None = None,
+    shards: int = 1,
 ) -> None:
     """Main execution function for stir tests.
 
@@ -66,13 +70,15 @@ async def main(
         tags: Tag-based filters
         types: Component type filters
         regex_pattern: Regex pattern for filtering
+        shards: Number of child processes to partition large suites across
     """
-    from rich.live import Live
+    from tofusoup.stir.display import generate_status_table, remove_status
+    from tofusoup.stir.sharding import record_results, run_shards, should_shard
 
-    from tofusoup.stir.display import generate_status_table, live_updater
-
-    start_time = monotonic()
-    base_dir = Path(target_path).resolve()
+    start_ns = perf_counter_ns()
+    base_dir = Path(target_path)
+    if not base_dir.is_absolute():
+        base_dir = base_dir.resolve()
 
     # Use enhanced test discovery
     discoverer = TestDiscovery(patterns=patterns, recursive=recursive)
@@ -92,44 +98,63 @@ async def main(
     # Initialize test directories for status tracking
     initialize_tests(test_dirs)
 
-    # Start live display with optimal refresh rate for smooth updates without flickering
-    # Banner and info will be shown in the live display context to avoid conflicts
-    stop_event = asyncio.Event()
-    with Live(generate_status_table(), console=console, refresh_per_second=0.77) as live_display:
-        # Show banner once inside live context (won't conflict with table updates)
+    results: Sequence[TestResult | BaseException]
+    if should_shard(len(test_dirs), shards):
+        # Sharded execution: children run without a live display; render one merged table at the end
         console.print("[bold]🚀 Tofusoup Stir[/bold]")
-        console.print(
-            f"Found {len(test_dirs)} test suites in '{base_dir}'. Running up to {MAX_CONCURRENT_TESTS} in parallel..."
-        )
-        console.print()  # Empty line for spacing
-        # Start the live updater task
-        updater_task = asyncio.create_task(live_updater(live_display, stop_event))
-
-        try:
-            # Phase 1: Provider preparation (serial) - now with live display active
-            await runtime.prepare_providers(test_dirs)
+        console.print(f"Found {len(test_dirs)} test suites in '{base_dir}'. Running across {shards} shards...")
+        console.print()
 
-            # Remove provider prep entry after completion to avoid clutter
-            from tofusoup.stir.display import test_statuses
+        # Providers are prepared once here so shards never race on the plugin cache
+        await runtime.prepare_providers(test_dirs)
 
-            test_statuses.pop("__PROVIDER_PREP__", None)
+        remove_status("__PROVIDER_PREP__")
 
-            # Phase 2: Test execution (parallel)
-            results = await execute_tests(test_dirs, runtime)
-        finally:
-            # Stop the live updater
-            stop_event.set()
-            await updater_task
+        results = await asyncio.to_thread(run_shards, test_dirs, runtime, shards)
+        record_results(results)
+        console.print(generate_status_table())
+    else:
+        results = await _run_with_live_display(test_dirs, base_dir, runtime)
 
     failed_tests, skipped_count, all_passed = process_results(results)
 
-    duration = monotonic() - start_time
+    duration = (perf_counter_ns() - start_ns) / 1e9
     print_summary_panel(len(test_dirs), len(failed_tests), skipped_count, duration)
 
     if not all_passed:
         sys.exit(1)
 
 
+async def _run_with_live_display(
+    test_dirs: list[Path], base_dir: Path, runtime: StirRuntime
+) -> list[TestResult]:
+    """Prepare providers and run all tests in this process under the live status table."""
+    from rich.live import Live
+
+    from tofusoup.stir.display import generate_status_table, remove_status
+
+    # Let rich's auto-refresh thread pull a fresh table at a low rate for smooth updates without
+    # flickering. Banner and info will be shown in the live display context to avoid conflicts
+    with Live(console=console, refresh_per_second=0.77, get_renderable=generate_status_table):
+        # Show banner once inside live context (won't conflict with table updates)
+        console.print("[bold]🚀 Tofusoup Stir[/bold]")
+        console.print(
+            f"Found {len(test_dirs)} test suites in '{base_dir}'. Running up to {MAX_CONCURRENT_TESTS} in parallel..."
+        )
+        console.print()  # Empty line for spacing
+
+        # Phase 1: Provider preparation (serial) - now with live display active
+        await runtime.prepare_providers(test_dirs)
+
+        # Remove provider prep entry after completion to avoid clutter
+        remove_status("__PROVIDER_PREP__")
+
+        # Phase 2: Test execution (parallel)
+        results = await execute_tests(test_dirs, runtime)
+
+    return results
+
+
 @click.command("stir")
 @click.argument(
     "path",
@@ -194,6 +219,13 @@ async def main(
     is_flag=True,
     help="Disable plugin caching (downloads providers for each test)",
 )
+@click.option(
+    "--shards",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Partition large suites across this many processes (e.g. CPU cores - 2)",
+)
 def stir_cli(
     path: str,
     pattern: tuple[str, ...],
@@ -207,6 +239,7 @@ def stir_cli(
     output_json: bool,
     upgrade: bool,
     no_cache: bool,
+    shards: int,
 ) -> None:
     """
     Run multi-threaded Terraform tests against all subdirectories in a given PATH.
@@ -237,17 +270,18 @@ def stir_cli(
                     )
                     sys.exit(1)
 
-                results = asyncio.run(run_matrix_stir_tests(Path(path)))
+                results = run_coroutine(run_matrix_stir_tests(Path(path)))
 
-                if matrix_output:
-                    import json
+                if matrix_output or output_json:
+                    from tofusoup.common.serialization import fast_json_dumps
 
-                    Path(matrix_output).write_text(json.dumps(results, indent=2, default=str))
+                    results_json = fast_json_dumps(results, indent=True, default=str)
 
-                if output_json:
-                    import json
+                    if matrix_output:
+                        Path(matrix_output).write_bytes(results_json)
 
-                    console.print(json.dumps(results, indent=2, default=str))
+                    if output_json:
+                        console.print(results_json.decode())
 
             except ImportError as e:
                 console.print(
@@ -267,18 +301,9 @@ def stir_cli(
                 tags=list(tags) if tags else None,
                 types=list(types) if types else None,
                 regex_pattern=regex_pattern,
+                shards=shards,
             )
-            if sys.platform == "win32":
-                # Windows requires ProactorEventLoop for subprocess support.
-                # asyncio.run() may not respect the policy in Python 3.11,
-                # so create the loop explicitly.
-                loop = asyncio.ProactorEventLoop()
-                try:
-                    loop.run_until_complete(coro)
-                finally:
-                    loop.close()
-            else:
-                asyncio.run(coro)
+            run_coroutine(coro)
 
     except KeyboardInterrupt:
         console.print("\n[yellow]⚠️ Interrupted by user[/yellow]")
@@ -60,4 +60,20 @@ PHASE_EMOJI = {
     "SKIPPED": "⏭️",  # Test skipped (no .tf files or other reason)
 }
 
+# Phase presets for the status table: phase id -> (phase text, style, active)
+# DESTROYING_FAILED is the destroy step that follows a failed apply.
+PHASES: dict[str, tuple[str, str, bool]] = {
+    "PENDING": ("PENDING", "dim", False),
+    "SKIPPED": ("SKIPPED", "dim", False),
+    "CLEANING": ("CLEANING", "dim yellow", True),
+    "INIT": ("INIT", "yellow", True),
+    "APPLYING": ("APPLYING", "blue", True),
+    "ANALYZING": ("ANALYZING", "magenta", True),
+    "DESTROYING": ("DESTROYING", "dim green", True),
+    "DESTROYING_FAILED": ("DESTROYING", "dim red", True),
+    "PASS": ("PASS", "bold green", False),
+    "FAIL": ("FAIL", "bold red", False),
+    "ERROR": ("ERROR", "bold red", False),
+}
+
 # 🥣🔬🔚
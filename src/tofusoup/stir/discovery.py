@@ -8,11 +8,28 @@
 from __future__ import annotations
 
 import fnmatch
+from functools import lru_cache
+import os
 from pathlib import Path
 import re
 import tomllib
 
+# Hidden directories that are still traversed during discovery
+_SPECIAL_HIDDEN_DIRS = frozenset({".plating-tests", ".soup-tests", ".soup"})
 
+
+def _is_glob(pattern: str) -> bool:
+    """Return True if the pattern contains fnmatch wildcard characters."""
+    return any(c in pattern for c in "*?[")
+
+
+@lru_cache(maxsize=256)
+def _compile_regex(pattern: str) -> re.Pattern[str]:
+    """Compile a regex, sharing the compiled object across filter instances."""
+    return re.compile(pattern)
+
+
+@lru_cache(maxsize=256)
 def _compile_glob(pattern: str) -> re.Pattern[str]:
     """Compile an fnmatch glob pattern into a reusable regex."""
     return re.compile(fnmatch.translate(pattern))
@@ -80,9 +97,13 @@ class TestDiscovery:
             "node_modules",
         ]
 
+        # Hash-based lookups for the marker files and literal default excludes
+        self._markers = frozenset(self.test_markers)
+        self._exclude_exact = frozenset(e for e in self.default_excludes if not _is_glob(e))
+
         # Pre-compile exclude patterns into single combined regexes for O(1) matching.
-        # _default_name_re matches any default exclude pattern against the directory name.
-        self._default_name_re = _combine_globs(self.default_excludes)
+        # _default_name_re matches any wildcard default exclude against the directory name.
+        self._default_name_re = _combine_globs([e for e in self.default_excludes if _is_glob(e)])
         # _default_substr_re matches any default exclude as a substring in the full path.
         self._default_substr_re: re.Pattern[str] | None = (
             re.compile("|".join(re.escape(e) for e in self.default_excludes))
@@ -101,7 +122,10 @@ class TestDiscovery:
         Returns:
             List of discovered test directory paths
         """
-        base_path = Path(base_path).resolve()
+        base_path = Path(base_path)
+        # Callers such as the CLI already pass resolved paths; skip the realpath syscalls then
+        if not base_path.is_absolute():
+            base_path = base_path.resolve()
 
         # Handle non-existent paths or files
         if not base_path.exists() or not base_path.is_dir():
@@ -189,10 +213,13 @@ class TestDiscovery:
         Returns:
             True if directory contains tests
         """
-        # Check for test marker files
-        for marker in self.test_markers:
-            if (path / marker).exists():
-                return True
+        # Check for test marker files with a single directory listing
+        try:
+            with os.scandir(path) as entries:
+                if not self._markers.isdisjoint(entry.name for entry in entries):
+                    return True
+        except OSError:
+            return False
 
         # Check for files matching patterns
         return any(list(path.glob(pattern)) for pattern in self.patterns)
@@ -210,7 +237,11 @@ class TestDiscovery:
         """
         name = path.name
 
-        # O(1) check: single combined regex matches name against all default globs
+        # O(1) check: hash lookup for literal default excludes
+        if name in self._exclude_exact:
+            return True
+
+        # O(1) check: single combined regex matches name against wildcard default excludes
         if self._default_name_re is not None and self._default_name_re.match(name):
             return True
 
@@ -226,7 +257,7 @@ class TestDiscovery:
             return True
 
         # Check for hidden directories (except special ones)
-        return bool(name.startswith(".") and name not in {".plating-tests", ".soup-tests", ".soup"})
+        return name.startswith(".") and name not in _SPECIAL_HIDDEN_DIRS
 
     def _filter_tests(self, tests: list[Path]) -> list[Path]:
         """Apply additional filtering to discovered tests.
@@ -292,7 +323,11 @@ class TestFilter:
         self.path_filters = path_filters or []
         self.tags = tags or []
         self.types = types or []
-        self.regex_pattern = re.compile(regex_pattern) if regex_pattern else None
+        self.regex_pattern = _compile_regex(regex_pattern) if regex_pattern else None
+
+        # Split tags into positive/negated sets for O(1) set operations in _matches_tags
+        self._include_tags = frozenset(t for t in self.tags if not t.startswith("!"))
+        self._exclude_tags = frozenset(t[1:] for t in self.tags if t.startswith("!"))
 
         # Pre-compile path filter patterns for hot-path performance
         self._compiled_path_filters: list[tuple[bool, re.Pattern[str]]] = []
@@ -464,13 +499,10 @@ class TestFilter:
             True if test has required tags
         """
         all_tags = self._get_all_tags(test)
-        for tag in self.tags:
-            if tag.startswith("!"):
-                if tag[1:] in all_tags:
-                    return False
-            elif tag in all_tags:
-                return True
-        return bool(all(t.startswith("!") for t in self.tags))
+        if not self._exclude_tags.isdisjoint(all_tags):
+            return False
+        # If only negated tags were given, default to include
+        return not self._include_tags or not self._include_tags.isdisjoint(all_tags)
 
 
 def discover_tests_with_patterns(
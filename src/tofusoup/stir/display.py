@@ -3,45 +3,132 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
-"""Display utilities for test execution and status tracking."""
+"""Display utilities for test execution and status tracking.
 
-import asyncio
+The status table is rendered by rich's Live auto-refresh thread via
+``Live(get_renderable=generate_status_table)``, so reads of ``test_statuses``
+here always work on a snapshot of its items.
+
+Writers go through ``set_status``/``update_status`` so that each refresh only
+re-formats rows that actually changed (plus running rows, whose elapsed time
+ticks). Formatted cells are cached per row and fed to a fresh ``Table`` through
+its public ``add_row`` API on every refresh.
+"""
+
+import bisect
+import itertools
+import threading
 from time import monotonic
 from typing import Any
 
 from rich.console import Console
-from rich.live import Live
 from rich.table import Table
 
-from tofusoup.stir.config import PHASE_EMOJI
+from tofusoup.stir.config import PHASE_EMOJI, PHASES
+from tofusoup.stir.models import TestStatus
 
 # Shared state for the live display
-test_statuses: dict[str, dict[str, Any]] = {}
+test_statuses: dict[str, TestStatus] = {}
 
 # Rich Console Initialization
-console = Console(record=True)
+console = Console()
 
+# Incremental table state: rows written since the last refresh, rows whose elapsed time is
+# still ticking, and the cached formatted cells with their directory -> row index mapping.
+_dirty_lock = threading.Lock()
+_dirty_rows: set[str] = set()
+_running_rows: set[str] = set()
+_row_index: dict[str, int] = {}
+# Test directory names in display order, maintained incrementally by set_status()
+_sorted_dirs: list[str] = []
+_rows: list[list[str]] | None = None
+_rows_have_eph_col = False
 
-def _get_sorted_status_items() -> list[tuple[str, dict[str, Any]]]:
-    """Sort status items with __PROVIDER_PREP__ first if it exists."""
-    sorted_items = []
-    provider_prep_item = None
 
-    for directory, status_info in test_statuses.items():
-        if directory == "__PROVIDER_PREP__":
-            provider_prep_item = (directory, status_info)
-        else:
-            sorted_items.append((directory, status_info))
+def mark_dirty(dir_name: str) -> None:
+    """Flag a test's row for redraw after its TestStatus was mutated directly."""
+    with _dirty_lock:
+        _dirty_rows.add(dir_name)
+
+
+def _phase_emoji(phase_text: str) -> str:
+    """Map a phase text (e.g. "APPLYING" or "❌ FAIL") to its phase emoji."""
+    return PHASE_EMOJI.get(phase_text.split(" ")[-1], "❓")
+
+
+# Phase presets with their phase emoji resolved once at import
+_PHASE_TABLE: dict[str, tuple[str, str, bool, str]] = {
+    phase: (text, style, active, _phase_emoji(text)) for phase, (text, style, active) in PHASES.items()
+}
+
+
+def set_phase(dir_name: str, phase: str, **fields: Any) -> None:
+    """Move a test to a preset phase from config.PHASES and flag its row for redraw.
 
-    sorted_items = sorted(sorted_items)
+    Writes text, style, active and the phase emoji directly from a prebuilt tuple;
+    any extra fields (e.g. end_time) are applied alongside.
+    """
+    text, style, active, phase_emoji = _PHASE_TABLE[phase]
+    status = test_statuses[dir_name]
+    status.text = text
+    status.style = style
+    status.active = active
+    status.phase_emoji = phase_emoji
+    for name, value in fields.items():
+        setattr(status, name, value)
+    mark_dirty(dir_name)
+
+
+def set_status(dir_name: str, status: TestStatus) -> None:
+    """Replace the status entry for a test and flag its row for redraw."""
+    status.phase_emoji = _phase_emoji(status.text)
+    if dir_name != "__PROVIDER_PREP__":
+        # Keep display order sorted on insert so refreshes never re-sort
+        index = bisect.bisect_left(_sorted_dirs, dir_name)
+        if index == len(_sorted_dirs) or _sorted_dirs[index] != dir_name:
+            _sorted_dirs.insert(index, dir_name)
+    test_statuses[dir_name] = status
+    mark_dirty(dir_name)
+
+
+def remove_status(dir_name: str) -> None:
+    """Drop a status entry (e.g. the provider preparation row) from the table."""
+    test_statuses.pop(dir_name, None)
+    index = bisect.bisect_left(_sorted_dirs, dir_name)
+    if index < len(_sorted_dirs) and _sorted_dirs[index] == dir_name:
+        del _sorted_dirs[index]
+
+
+def update_status(dir_name: str, **fields: Any) -> None:
+    """Update fields of a test's status entry and flag its row for redraw."""
+    status = test_statuses[dir_name]
+    for name, value in fields.items():
+        setattr(status, name, value)
+    if "text" in fields:
+        # Resolve the phase emoji once per phase change rather than on every refresh
+        status.phase_emoji = _phase_emoji(status.text)
+    mark_dirty(dir_name)
+
+
+def _get_sorted_status_items() -> list[tuple[str, TestStatus]]:
+    """Return status items in display order, with __PROVIDER_PREP__ first if it exists.
+
+    Order comes from _sorted_dirs, which set_status() keeps sorted on insert.
+    """
+    # Snapshot: the refresh thread may race with inserts/pops on the event loop thread
+    statuses = dict(list(test_statuses.items()))
+    sorted_items = [(d, statuses[d]) for d in list(_sorted_dirs) if d in statuses]
 
-    if provider_prep_item:
-        sorted_items.insert(0, provider_prep_item)
+    provider_prep = statuses.get("__PROVIDER_PREP__")
+    if provider_prep is not None:
+        sorted_items.insert(0, ("__PROVIDER_PREP__", provider_prep))
 
     return sorted_items
 
 
-def _get_status_emoji(status_info: dict[str, Any]) -> str:
+def _compute_status_emoji(
+    pending: bool, active: bool, has_warnings: bool, skipped: bool, success: bool
+) -> str:
     """Get the status emoji based on test state.
 
     States:
@@ -53,35 +140,84 @@ def _get_status_emoji(status_info: dict[str, Any]) -> str:
     - ❌ Fail: Test failed (terraform command returned non-zero)
     """
     # Check if test is pending (queued but not started)
-    phase_text = status_info.get("text", "")
-    if phase_text == "PENDING":
+    if pending:
         return "[dim]💤[/dim]"
 
     # Active tests (currently running)
-    if status_info.get("active"):
-        return "[yellow]🔄[/yellow]" if not status_info.get("has_warnings") else "[yellow]⚠️[/yellow]"
+    if active:
+        return "[yellow]🔄[/yellow]" if not has_warnings else "[yellow]⚠️[/yellow]"
 
     # Completed states
-    elif status_info.get("skipped"):
+    elif skipped:
         return "[dim]⏭️[/dim]"
-    elif status_info.get("success"):
+    elif success:
         return "[green]✅[/green]"
     else:
         # Only show red X if test has actually failed (not pending)
         return "[red]❌[/red]"
 
 
-def _calculate_elapsed_time(start_time: float | None, end_time: float | None) -> str:
-    """Calculate elapsed time string."""
+# Every (pending, active, has_warnings, skipped, success) combination, precomputed at import
+_STATUS_EMOJI_TABLE: dict[tuple[bool, ...], str] = {
+    state: _compute_status_emoji(*state) for state in itertools.product((False, True), repeat=5)
+}
+
+
+def _get_status_emoji(status: TestStatus) -> str:
+    """Look up the status emoji for a test's current state."""
+    return _STATUS_EMOJI_TABLE[
+        (status.text == "PENDING", status.active, status.has_warnings, status.skipped, status.success)
+    ]
+
+
+def _calculate_elapsed_time(start_time: float | None, end_time: float | None, now: float) -> str:
+    """Calculate elapsed time string, using the refresh-wide `now` for running tests."""
     if not start_time:
         return ""
-    actual_end_time = end_time or monotonic()
+    actual_end_time = end_time or now
     elapsed = actual_end_time - start_time
     return f"{elapsed:.1f}s"
 
 
-def generate_status_table() -> Table:
-    """Generate a rich table showing current test status."""
+def _format_row(
+    directory: str, status: TestStatus, test_num_str: str, show_eph_func_col: bool, now: float
+) -> list[str]:
+    """Format the cells of a single status table row."""
+    elapsed_str = _calculate_elapsed_time(status.start_time, status.end_time, now)
+    phase_emoji = status.phase_emoji or _phase_emoji(status.text)
+    status_emoji = _get_status_emoji(status)
+
+    # Special formatting for provider prep row
+    # Test rows carry markup pre-built in initialize_tests(); only the provider prep row is inline
+    display_name = status.display_name or (
+        "[bold magenta]Provider Cache Preparation[/bold magenta]"
+        if directory == "__PROVIDER_PREP__"
+        else f"[bold]{directory}[/bold]"
+    )
+
+    row_data = [
+        status_emoji,
+        phase_emoji,
+        test_num_str,
+        display_name,
+        elapsed_str,
+        str(status.providers),
+        str(status.resources),
+        str(status.data_sources),
+        str(status.functions),
+    ]
+    if show_eph_func_col:
+        row_data.append(str(status.ephemeral_functions))
+    row_data.extend([str(status.outputs), status.last_log])
+    return row_data
+
+
+def _is_running(status: TestStatus) -> bool:
+    return bool(status.start_time) and not status.end_time
+
+
+def _new_table(show_eph_func_col: bool) -> Table:
+    """Create an empty status table with its columns."""
     table = Table(box=None, expand=True, show_header=True)
     table.add_column("Status", justify="center", width=4)
     table.add_column("Phase", justify="center", width=4)
@@ -93,26 +229,26 @@ def generate_status_table() -> Table:
     table.add_column("Data", justify="center", style="blue", width=5)
     table.add_column("Func", justify="center", style="blue", width=5)
 
-    show_eph_func_col = any(status.get("ephemeral_functions", 0) > 0 for status in test_statuses.values())
     if show_eph_func_col:
         table.add_column("Eph. Func", justify="center", style="blue", width=9)
 
     table.add_column("Outs", justify="center", style="blue", width=5)
     table.add_column("Last Log", justify="left", style="yellow", ratio=5)
+    return table
+
 
-    # Get sorted items and calculate total test count (excluding provider prep)
-    sorted_items = _get_sorted_status_items()
+def _build_rows(
+    sorted_items: list[tuple[str, TestStatus]], show_eph_func_col: bool, now: float
+) -> list[list[str]]:
+    """Format every status row from scratch."""
+    # Calculate total test count (excluding provider prep)
     total_tests = sum(1 for directory, _ in sorted_items if directory != "__PROVIDER_PREP__")
 
+    _row_index.clear()
+    _running_rows.clear()
+    rows = []
     test_number = 0
-    for directory, status_info in sorted_items:
-        phase_text = status_info["text"]
-        last_log = status_info.get("last_log", "")
-
-        elapsed_str = _calculate_elapsed_time(status_info.get("start_time"), status_info.get("end_time"))
-        phase_emoji = PHASE_EMOJI.get(phase_text.split(" ")[-1], "❓")
-        status_emoji = _get_status_emoji(status_info)
-
+    for row, (directory, status) in enumerate(sorted_items):
         # Calculate test number (skip provider prep)
         if directory != "__PROVIDER_PREP__":
             test_number += 1
@@ -120,37 +256,53 @@ def generate_status_table() -> Table:
         else:
             test_num_str = ""
 
-        # Special formatting for provider prep row
-        display_name = (
-            "[bold magenta]Provider Cache Preparation[/bold magenta]"
-            if directory == "__PROVIDER_PREP__"
-            else f"[bold]{directory}[/bold]"
-        )
-
-        row_data = [
-            status_emoji,
-            phase_emoji,
-            test_num_str,
-            display_name,
-            elapsed_str,
-            str(status_info.get("providers", "")),
-            str(status_info.get("resources", "")),
-            str(status_info.get("data_sources", "")),
-            str(status_info.get("functions", "")),
-        ]
-        if show_eph_func_col:
-            row_data.append(str(status_info.get("ephemeral_functions", "")))
-        row_data.extend([str(status_info.get("outputs", "")), last_log])
-        table.add_row(*row_data)
+        rows.append(_format_row(directory, status, test_num_str, show_eph_func_col, now))
+        _row_index[directory] = row
+        if _is_running(status):
+            _running_rows.add(directory)
 
-    return table
+    return rows
 
 
-async def live_updater(live_display: Live, stop_event: asyncio.Event) -> None:
-    """Update the live display with current test statuses."""
-    while not stop_event.is_set():
-        live_display.update(generate_status_table())
-        await asyncio.sleep(1 / 0.77)  # ~1.3 seconds to match 0.77 Hz refresh rate
+def generate_status_table() -> Table:
+    """Generate a rich table showing current test status.
+
+    Formatted rows are cached between calls. They are only all re-formatted when the set
+    of tests or the visible columns change; otherwise only dirty and still-running rows
+    are re-formatted before the cached rows are added to a new table.
+    """
+    global _rows, _rows_have_eph_col
+
+    # One clock read per refresh, shared by every running row's elapsed time
+    now = monotonic()
+
+    with _dirty_lock:
+        dirty = _dirty_rows.copy()
+        _dirty_rows.clear()
+
+    snapshot = dict(list(test_statuses.items()))
+    show_eph_func_col = any(status.ephemeral_functions > 0 for status in snapshot.values())
+
+    if _rows is None or show_eph_func_col != _rows_have_eph_col or snapshot.keys() != _row_index.keys():
+        _rows = _build_rows(_get_sorted_status_items(), show_eph_func_col, now)
+        _rows_have_eph_col = show_eph_func_col
+    else:
+        for directory in dirty | _running_rows:
+            status = snapshot.get(directory)
+            if status is None:
+                continue
+            row = _row_index[directory]
+            # The test number column never changes between rebuilds; keep the existing cell
+            _rows[row] = _format_row(directory, status, _rows[row][2], show_eph_func_col, now)
+            if _is_running(status):
+                _running_rows.add(directory)
+            else:
+                _running_rows.discard(directory)
+
+    table = _new_table(show_eph_func_col)
+    for cells in _rows:
+        table.add_row(*cells)
+    return table
 
 
 # 🥣🔬🔚
@@ -34,205 +34,286 @@ Other States:
 """
 
 import asyncio
+from collections.abc import Coroutine
+import contextlib
 import json
+import os
 from pathlib import Path
-import shutil
+import sys
 from time import monotonic
+from typing import Any, TypeVar
 
+from tofusoup.common.serialization import fast_json_loads
+from tofusoup.config.defaults import ENV_TOFUSOUP_UVLOOP
 from tofusoup.stir.config import LOGS_DIR, MAX_CONCURRENT_TESTS
-from tofusoup.stir.display import console, test_statuses
-from tofusoup.stir.models import TestResult
+from tofusoup.stir.display import console, set_phase, set_status, test_statuses, update_status
+from tofusoup.stir.models import TestResult, TestStatus
 from tofusoup.stir.runtime import StirRuntime
-from tofusoup.stir.terraform import run_terraform_command
+from tofusoup.stir.terraform import ensure_dir, forget_ensured_dirs, run_terraform_command
 
+_T = TypeVar("_T")
 
-async def run_test_lifecycle(
-    directory: Path, semaphore: asyncio.Semaphore, runtime: StirRuntime
-) -> TestResult:
+
+_ERROR_LEVELS = frozenset({"error", "critical"})
+
+
+def _filter_error_logs(parsed_logs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Select the error/critical log entries once, so reporting is O(errors) rather than O(logs)."""
+    return [log for log in parsed_logs if log.get("@level") in _ERROR_LEVELS]
+
+
+def _has_tf_files(directory: Path) -> bool:
+    """Check whether a directory contains any *.tf entry, stopping at the first match."""
+    try:
+        with os.scandir(directory) as entries:
+            return any(entry.name.endswith(".tf") for entry in entries)
+    except OSError:
+        return False
+
+
+# Prefixes/names of terraform artifacts removed before each test run
+_CLEANUP_PREFIXES = (".terraform", "terraform.tfstate")
+_CLEANUP_NAMES = frozenset({".soup"})
+
+
+def _fast_rmtree(path: str) -> None:
+    """Remove a directory tree using an explicit os.scandir stack.
+
+    Files and symlinks are unlinked as they are found; directories are removed
+    afterwards, deepest first. Errors are ignored, like shutil.rmtree(ignore_errors=True).
+    """
+    stack = [path]
+    visited: list[str] = []
+    while stack:
+        current = stack.pop()
+        visited.append(current)
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        with contextlib.suppress(OSError):
+                            os.unlink(entry.path)  # noqa: PTH108
+        except OSError:
+            continue
+
+    # Pre-order visit list reversed yields children before their parents
+    for directory in reversed(visited):
+        with contextlib.suppress(OSError):
+            os.rmdir(directory)  # noqa: PTH106
+
+
+def _clean_test_directory(directory: Path) -> None:
+    """Remove terraform artifacts left over from previous runs.
+
+    Runs synchronously so the whole cleanup costs a single thread offload.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            targets = [
+                entry
+                for entry in entries
+                if entry.name.startswith(_CLEANUP_PREFIXES) or entry.name in _CLEANUP_NAMES
+            ]
+    except OSError:
+        return
+
+    for entry in targets:
+        if entry.is_dir(follow_symlinks=False):
+            _fast_rmtree(entry.path)
+        else:
+            with contextlib.suppress(OSError):
+                os.unlink(entry.path)  # noqa: PTH108
+
+
+async def run_test_lifecycle(directory: Path, runtime: StirRuntime) -> TestResult:
     """Execute the full lifecycle of a Terraform test."""
     dir_name = directory.name
+    # Bind the status entry once; writes still go through set_phase()/update_status() for dirty tracking
+    status = test_statuses[dir_name]
     start_time = monotonic()
 
-    async with semaphore:
-        try:
-            if not any(directory.glob("*.tf")):
-                test_statuses[dir_name].update(
-                    text="SKIPPED",
-                    style="dim",
-                    active=False,
-                    success=True,
-                    skipped=True,
-                    start_time=start_time,
-                    end_time=monotonic(),
-                )
-                return TestResult(
-                    directory=dir_name,
-                    success=True,
-                    skipped=True,
-                    start_time=start_time,
-                    end_time=monotonic(),
-                )
-
-            test_statuses[dir_name].update(
-                text="CLEANING",
-                style="dim yellow",
-                active=True,
-                last_log="",
+    try:
+        if not status.has_tf:
+            set_phase(
+                dir_name,
+                "SKIPPED",
+                success=True,
+                skipped=True,
                 start_time=start_time,
+                end_time=monotonic(),
             )
-            for pattern in [".terraform*", "terraform.tfstate*", ".soup"]:
-                for path in directory.glob(pattern):
-                    if path.is_dir():
-                        await asyncio.to_thread(shutil.rmtree, path, ignore_errors=True)
-                    else:
-                        await asyncio.to_thread(path.unlink, missing_ok=True)
+            return TestResult(
+                directory=dir_name,
+                success=True,
+                skipped=True,
+                start_time=start_time,
+                end_time=monotonic(),
+            )
+
+        set_phase(
+            dir_name,
+            "CLEANING",
+            last_log="",
+            start_time=start_time,
+        )
+        await asyncio.to_thread(_clean_test_directory, directory)
+        # .soup was just removed; its log/data dirs must be created again
+        forget_ensured_dirs(directory)
 
-            test_statuses[dir_name].update(text="INIT", style="yellow")
+        set_phase(dir_name, "INIT")
 
-            # Use providers that were pre-downloaded by runtime
-            runtime.validate_ready()
+        # Use providers that were pre-downloaded by runtime
+        runtime.validate_ready()
 
-            init_rc, _, _, _, _, _ = await run_terraform_command(
-                directory, ["init", "-no-color", "-input=false"], runtime=runtime
+        init_rc, _, _, _, _, _ = await run_terraform_command(
+            directory, ["init", "-no-color", "-input=false"], runtime=runtime
+        )
+        if init_rc != 0:
+            end_time = monotonic()
+            set_phase(
+                dir_name,
+                "FAIL",
+                success=False,
+                end_time=end_time,
             )
-            if init_rc != 0:
-                end_time = monotonic()
-                test_statuses[dir_name].update(
-                    text="FAIL",
-                    style="bold red",
-                    active=False,
-                    success=False,
-                    end_time=end_time,
-                )
-                return TestResult(
-                    directory=dir_name,
-                    success=False,
-                    skipped=False,
-                    start_time=start_time,
-                    end_time=end_time,
-                )
 
-            test_statuses[dir_name].update(text="APPLYING", style="blue")
-            (
-                apply_rc,
-                _,
-                stdout_log,
-                stderr_log,
-                tf_log,
-                parsed_logs,
-            ) = await run_terraform_command(
-                directory, ["apply", "-input=false", "-auto-approve"], runtime=runtime, tail_log=True
+            return TestResult(
+                directory=dir_name,
+                success=False,
+                skipped=False,
+                start_time=start_time,
+                end_time=end_time,
             )
 
-            if apply_rc == 0:
-                test_statuses[dir_name].update(text="ANALYZING", style="magenta")
-                show_rc, show_stdout, _, _, _, _ = await run_terraform_command(
-                    directory, ["show", "-json"], runtime=runtime, capture_stdout=True
-                )
+        set_phase(dir_name, "APPLYING")
+        (
+            apply_rc,
+            _,
+            stdout_log,
+            stderr_log,
+            tf_log,
+            parsed_logs,
+        ) = await run_terraform_command(
+            directory, ["apply", "-input=false", "-auto-approve"], runtime=runtime, tail_log=True
+        )
 
-                if show_rc == 0:
-                    try:
-                        state = json.loads(show_stdout)
-                        test_statuses[dir_name]["providers"] = len(state.get("provider_configs", {}))
-                        root_module = state.get("values", {}).get("root_module", {})
-                        resources = [r for r in root_module.get("resources", []) if r.get("mode") == "managed"]
-                        data_sources = [r for r in root_module.get("resources", []) if r.get("mode") == "data"]
-                        test_statuses[dir_name]["resources"] = len(resources)
-                        test_statuses[dir_name]["data_sources"] = len(data_sources)
-                        test_statuses[dir_name]["outputs"] = len(state.get("values", {}).get("outputs", {}))
-                    except json.JSONDecodeError:
-                        pass
-
-                test_statuses[dir_name].update(text="DESTROYING", style="dim green")
-                await run_terraform_command(
-                    directory,
-                    ["destroy", "-auto-approve", "-input=false"],
-                    runtime=runtime,
-                    tail_log=True,
-                )
-                end_time = monotonic()
-                test_statuses[dir_name].update(
-                    text="PASS",
-                    style="bold green",
-                    active=False,
-                    success=True,
-                    end_time=end_time,
-                )
+        if apply_rc == 0:
+            set_phase(dir_name, "ANALYZING")
+            show_rc, show_stdout, _, _, _, _ = await run_terraform_command(
+                directory, ["show", "-json"], runtime=runtime, capture_stdout=True
+            )
 
-                status = test_statuses[dir_name]
-                return TestResult(
-                    directory=dir_name,
-                    success=True,
-                    skipped=False,
-                    start_time=start_time,
-                    end_time=end_time,
-                    stdout_log_path=stdout_log,
-                    stderr_log_path=stderr_log,
-                    tf_log_path=tf_log,
-                    parsed_logs=parsed_logs,
-                    outputs=status.get("outputs", 0),
-                    has_warnings=status.get("has_warnings", False),
-                    providers=status.get("providers", 0),
-                    resources=status.get("resources", 0),
-                    data_sources=status.get("data_sources", 0),
-                    functions=status.get("functions", 0),
-                    ephemeral_functions=status.get("ephemeral_functions", 0),
-                )
-            else:
-                test_statuses[dir_name].update(text="DESTROYING", style="dim red")
-                await run_terraform_command(
-                    directory,
-                    ["destroy", "-auto-approve", "-input=false"],
-                    runtime=runtime,
-                    tail_log=True,
-                )
-                end_time = monotonic()
-                test_statuses[dir_name].update(
-                    text="FAIL",
-                    style="bold red",
-                    active=False,
-                    success=False,
-                    end_time=end_time,
-                )
+            if show_rc == 0:
+                try:
+                    state = fast_json_loads(show_stdout)
+                    root_module = state.get("values", {}).get("root_module", {})
+                    # Count managed resources and data sources in a single pass
+                    managed_count = data_count = 0
+                    for resource in root_module.get("resources", ()):
+                        mode = resource.get("mode")
+                        if mode == "managed":
+                            managed_count += 1
+                        elif mode == "data":
+                            data_count += 1
+                    update_status(
+                        dir_name,
+                        providers=len(state.get("provider_configs", {})),
+                        resources=managed_count,
+                        data_sources=data_count,
+                        outputs=len(state.get("values", {}).get("outputs", {})),
+                    )
+                except json.JSONDecodeError:
+                    pass
 
-                status = test_statuses[dir_name]
-                return TestResult(
-                    directory=dir_name,
-                    success=False,
-                    skipped=False,
-                    start_time=start_time,
-                    end_time=end_time,
-                    stdout_log_path=stdout_log,
-                    stderr_log_path=stderr_log,
-                    tf_log_path=tf_log,
-                    parsed_logs=parsed_logs,
-                    outputs=status.get("outputs", 0),
-                    has_warnings=status.get("has_warnings", False),
-                    providers=status.get("providers", 0),
-                    resources=status.get("resources", 0),
-                    data_sources=status.get("data_sources", 0),
-                    functions=status.get("functions", 0),
-                    ephemeral_functions=status.get("ephemeral_functions", 0),
-                )
+            set_phase(dir_name, "DESTROYING")
+            await run_terraform_command(
+                directory,
+                ["destroy", "-auto-approve", "-input=false"],
+                runtime=runtime,
+                tail_log=True,
+            )
+            end_time = monotonic()
+            set_phase(
+                dir_name,
+                "PASS",
+                success=True,
+                end_time=end_time,
+            )
 
-        except Exception:
-            console.print_exception()
+            return TestResult(
+                directory=dir_name,
+                success=True,
+                skipped=False,
+                start_time=start_time,
+                end_time=end_time,
+                stdout_log_path=stdout_log,
+                stderr_log_path=stderr_log,
+                tf_log_path=tf_log,
+                parsed_logs=parsed_logs,
+                error_logs=_filter_error_logs(parsed_logs),
+                outputs=status.outputs,
+                has_warnings=status.has_warnings,
+                providers=status.providers,
+                resources=status.resources,
+                data_sources=status.data_sources,
+                functions=status.functions,
+                ephemeral_functions=status.ephemeral_functions,
+            )
+        else:
+            set_phase(dir_name, "DESTROYING_FAILED")
+            await run_terraform_command(
+                directory,
+                ["destroy", "-auto-approve", "-input=false"],
+                runtime=runtime,
+                tail_log=True,
+            )
             end_time = monotonic()
-            test_statuses[dir_name].update(
-                text="ERROR",
-                style="bold red",
-                active=False,
+            set_phase(
+                dir_name,
+                "FAIL",
                 success=False,
                 end_time=end_time,
             )
+
             return TestResult(
                 directory=dir_name,
                 success=False,
                 skipped=False,
                 start_time=start_time,
                 end_time=end_time,
+                stdout_log_path=stdout_log,
+                stderr_log_path=stderr_log,
+                tf_log_path=tf_log,
+                parsed_logs=parsed_logs,
+                error_logs=_filter_error_logs(parsed_logs),
+                outputs=status.outputs,
+                has_warnings=status.has_warnings,
+                providers=status.providers,
+                resources=status.resources,
+                data_sources=status.data_sources,
+                functions=status.functions,
+                ephemeral_functions=status.ephemeral_functions,
             )
 
+    except Exception:
+        console.print_exception()
+        end_time = monotonic()
+        set_phase(
+            dir_name,
+            "ERROR",
+            success=False,
+            end_time=end_time,
+        )
+        return TestResult(
+            directory=dir_name,
+            success=False,
+            skipped=False,
+            start_time=start_time,
+            end_time=end_time,
+        )
+
 
 def initialize_tests(test_dirs: list[Path]) -> None:
     """Initialize test directories and status tracking.
@@ -248,32 +329,78 @@ def initialize_tests(test_dirs: list[Path]) -> None:
     - dim red: Cleanup after failure (DESTROYING on failure path)
     - bold red: Final failure states (FAIL, ERROR)
     """
-    LOGS_DIR.mkdir(parents=True, exist_ok=True)
+    ensure_dir(LOGS_DIR)
     for d in test_dirs:
-        test_statuses[d.name] = {
-            "text": "PENDING",
-            "style": "dim",
-            "active": False,
-            "success": False,
-            "skipped": False,
-            "start_time": None,
-            "end_time": None,
-            "last_log": "",
-            "outputs": 0,
-            "has_warnings": False,
-            "providers": 0,
-            "resources": 0,
-            "data_sources": 0,
-            "functions": 0,
-            "ephemeral_functions": 0,
-        }
-
-
-async def execute_tests(test_dirs: list[Path], runtime: StirRuntime) -> list[TestResult | BaseException]:
-    """Execute all tests concurrently."""
-    semaphore = asyncio.Semaphore(MAX_CONCURRENT_TESTS)
-    tasks = [run_test_lifecycle(d, semaphore, runtime) for d in test_dirs]
-    return await asyncio.gather(*tasks, return_exceptions=True)
+        set_status(
+            d.name,
+            TestStatus(
+                display_name=f"[bold]{d.name}[/bold]",
+                # Precomputed here, during the serial init phase, so the check stays out of
+                # each worker's critical path
+                has_tf=_has_tf_files(d),
+            ),
+        )
+
+
+async def execute_tests(test_dirs: list[Path], runtime: StirRuntime) -> list[TestResult]:
+    """Execute all tests concurrently.
+
+    A fixed pool of MAX_CONCURRENT_TESTS workers in a TaskGroup pulls directories from a
+    queue, so only O(concurrency) tasks are alive at once and cancellation (e.g. Ctrl-C)
+    propagates cleanly. Unexpected errors become ERROR results inline, so every entry is a
+    TestResult. Results keep the order of test_dirs.
+    """
+    queue: asyncio.Queue[tuple[int, Path]] = asyncio.Queue()
+    for item in enumerate(test_dirs):
+        queue.put_nowait(item)
+    results: dict[int, TestResult] = {}
+
+    async def worker() -> None:
+        while not queue.empty():
+            index, directory = queue.get_nowait()
+            try:
+                results[index] = await run_test_lifecycle(directory, runtime)
+            except Exception as e:
+                now = monotonic()
+                results[index] = TestResult(
+                    directory=directory.name,
+                    success=False,
+                    skipped=False,
+                    start_time=now,
+                    end_time=now,
+                    error_message=str(e),
+                )
+
+    async with asyncio.TaskGroup() as tg:
+        for _ in range(min(MAX_CONCURRENT_TESTS, len(test_dirs))):
+            tg.create_task(worker())
+
+    return [results[index] for index in range(len(test_dirs))]
+
+
+def run_coroutine(coro: Coroutine[Any, Any, _T]) -> _T:
+    """Run a coroutine to completion on a fresh event loop suitable for subprocesses.
+
+    Setting TOFUSOUP_UVLOOP=1 opts into a uvloop event loop when uvloop is installed.
+    """
+    if os.environ.get(ENV_TOFUSOUP_UVLOOP) == "1" and sys.platform != "win32":
+        try:
+            import uvloop  # type: ignore[import-not-found]
+        except ImportError:
+            pass
+        else:
+            with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+                return runner.run(coro)
+    if sys.platform == "win32":
+        # Windows requires ProactorEventLoop for subprocess support.
+        # asyncio.run() may not respect the policy in Python 3.11,
+        # so create the loop explicitly.
+        loop = asyncio.ProactorEventLoop()
+        try:
+            return loop.run_until_complete(coro)
+        finally:
+            loop.close()
+    return asyncio.run(coro)
 
 
 # 🥣🔬🔚
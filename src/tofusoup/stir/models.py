@@ -5,10 +5,13 @@
 
 
 from pathlib import Path
-from typing import Any, NamedTuple
+from typing import Any
 
+from attrs import define, field
 
-class StirTestResult(NamedTuple):
+
+@define(frozen=True)
+class StirTestResult:
     """Represents the result of running a single test."""
 
     directory: str
@@ -16,22 +19,54 @@ class StirTestResult(NamedTuple):
     skipped: bool
     start_time: float
     end_time: float
-    stdout_log_path: Path | None = None
-    stderr_log_path: Path | None = None
-    tf_log_path: Path | None = None
-    parsed_logs: list[dict[str, Any]] = []  # noqa: RUF012
-    outputs: int = 0
-    has_warnings: bool = False
-    providers: int = 0
-    resources: int = 0
-    data_sources: int = 0
-    functions: int = 0
-    ephemeral_functions: int = 0
-    failed_stage: str | None = None
-    error_message: str | None = None
-
-
-# Backwards compatibility alias
+    stdout_log_path: Path | None = field(default=None)
+    stderr_log_path: Path | None = field(default=None)
+    tf_log_path: Path | None = field(default=None)
+    parsed_logs: list[dict[str, Any]] = field(factory=list)
+    # Subset of parsed_logs at error/critical level, filtered once when the result is built
+    error_logs: list[dict[str, Any]] = field(factory=list)
+    outputs: int = field(default=0)
+    has_warnings: bool = field(default=False)
+    providers: int = field(default=0)
+    resources: int = field(default=0)
+    data_sources: int = field(default=0)
+    functions: int = field(default=0)
+    ephemeral_functions: int = field(default=0)
+    failed_stage: str | None = field(default=None)
+    error_message: str | None = field(default=None)
+
+
+@define
+class StirTestStatus:
+    """Live display state of a single test, one row of the status table.
+
+    Mutated in place by the display helpers (set_phase/update_status) while the test runs.
+    """
+
+    text: str = field(default="PENDING")
+    style: str = field(default="dim")
+    active: bool = field(default=False)
+    success: bool = field(default=False)
+    skipped: bool = field(default=False)
+    start_time: float | None = field(default=None)
+    end_time: float | None = field(default=None)
+    last_log: str = field(default="")
+    outputs: int = field(default=0)
+    has_warnings: bool = field(default=False)
+    providers: int = field(default=0)
+    resources: int = field(default=0)
+    data_sources: int = field(default=0)
+    functions: int = field(default=0)
+    ephemeral_functions: int = field(default=0)
+    # Pre-built row markup and phase emoji, so refreshes don't re-derive them
+    display_name: str = field(default="")
+    phase_emoji: str = field(default="")
+    # Whether the directory has any .tf files, checked once during initialization
+    has_tf: bool = field(default=True)
+
+
+# Backwards compatibility aliases
 TestResult = StirTestResult
+TestStatus = StirTestStatus
 
 # 🥣🔬🔚
@@ -5,10 +5,7 @@
 
 """Test result reporting and display utilities."""
 
-import json
-
-from rich.panel import Panel
-from rich.syntax import Syntax
+from rich.console import Group, RenderableType
 from rich.table import Table
 from rich.text import Text
 
@@ -17,40 +14,44 @@ from tofusoup.stir.models import TestResult
 
 
 def print_failure_report(result: TestResult) -> None:
-    """Print a detailed failure report for a failed test."""
+    """Print a detailed failure report for a failed test.
+
+    The report is assembled into a single Group and written with one console.print call.
+    """
+    # Only needed when a test fails; kept out of module import to trim CLI startup
+    from rich.json import JSON
+
     title = f"🚨 Failure Report for {result.directory} "
-    console.print(f"[bold red]{title.center(80, '─')}[/bold red]")
+    renderables: list[RenderableType] = [Text.from_markup(f"[bold red]{title.center(80, '─')}[/bold red]")]
 
-    error_logs = [log for log in result.parsed_logs if log.get("@level") in ("error", "critical")]
+    error_logs = result.error_logs
 
     if not error_logs:
-        console.print(
-            "[yellow]No specific error messages found in log. The failure may have been a crash.[/yellow]"
+        renderables.append(
+            Text.from_markup(
+                "[yellow]No specific error messages found in log. The failure may have been a crash.[/yellow]"
+            )
         )
     else:
-        console.print(Text.from_markup(f"\n[bold]Error Log Events ({len(error_logs)} found):[/bold]"))
+        renderables.append(Text.from_markup(f"\n[bold]Error Log Events ({len(error_logs)} found):[/bold]"))
         for error_log in error_logs:
-            console.print(
-                Syntax(
-                    json.dumps(error_log, indent=2),
-                    "json",
-                    theme="monokai",
-                    line_numbers=False,
-                    word_wrap=True,
-                )
-            )
-            console.print("-" * 20)
+            # rich's JSON renderable uses a prebuilt highlighter instead of a pygments lexer/theme per log
+            renderables.append(JSON.from_data(error_log, indent=2))
+            renderables.append(Text("-" * 20))
 
     if result.tf_log_path:
-        console.print(
+        renderables.append(
             Text.from_markup(f"\n[bold]Full Terraform Log:[/bold] [yellow]{result.tf_log_path}[/yellow]")
         )
 
-    console.print("\n" + "─" * 80 + "\n")
+    renderables.append(Text("\n" + "─" * 80 + "\n"))
+    console.print(Group(*renderables))
 
 
 def print_summary_panel(total_tests: int, failed_tests: int, skipped_tests: int, duration: float) -> None:
     """Print a summary panel with test results."""
+    from rich.panel import Panel
+
     passed_tests = total_tests - failed_tests - skipped_tests
     success = failed_tests == 0
 
@@ -4,11 +4,119 @@
 #
 
 
+import asyncio
+from functools import lru_cache
+import os
 from pathlib import Path
 import re
-import tempfile
 
+from tofusoup.stir.config import ENV_VARS
 from tofusoup.stir.display import console
+from tofusoup.stir.models import TestStatus
+
+# Provider requirement patterns, compiled once and reused for every scanned .tf file
+_RE_REQUIRED_BLOCK_START = re.compile(r"required_providers\s*\{")
+_RE_BRACE = re.compile(r"[{}]")
+# Handles compact format like: pyvider = { source = "...", version = "..." }
+_RE_PROVIDER_ENTRY = re.compile(r"(\w+)\s*=\s*\{\s*(.+?)\s*(?:\}|$)", re.DOTALL)
+_RE_SOURCE = re.compile(r'source\s*=\s*"([^"]+)"')
+_RE_VERSION = re.compile(r'version\s*=\s*"([^"]+)"')
+_RE_LEGACY = re.compile(r'provider\s+"([^"]+)"\s*\{')
+
+
+def base_terraform_env() -> dict[str, str]:
+    """Build the environment shared by every stir terraform command, starting from os.environ."""
+    env = os.environ.copy()
+    env[ENV_VARS["TF_LOG"]] = "JSON"
+    env[ENV_VARS["PYVIDER_PRIVATE_STATE_SHARED_SECRET"]] = "stir-test-secret"
+    env["PYVIDER_TESTMODE"] = "true"
+    return env
+
+
+def _find_required_providers_blocks(content: str) -> list[str]:
+    """Return the body of every balanced `required_providers { ... }` block in content.
+
+    Braces are matched with a depth counter over the brace positions only, so the scan
+    is linear in the content size and cannot backtrack on deeply nested blocks.
+    """
+    blocks = []
+    pos = 0
+    while block_start := _RE_REQUIRED_BLOCK_START.search(content, pos):
+        body_start = pos = block_start.end()
+        depth = 1
+        for brace in _RE_BRACE.finditer(content, body_start):
+            depth += 1 if brace.group() == "{" else -1
+            if depth == 0:
+                blocks.append(content[body_start : brace.start()])
+                pos = brace.end()
+                break
+        else:
+            # Unbalanced block: nothing further can close
+            break
+    return blocks
+
+
+def _collect_tf_files(test_dirs: list[Path]) -> list[tuple[Path, Path]]:
+    """List (test_dir, tf_file) pairs for every *.tf file directly inside the test directories."""
+    tf_files: list[tuple[Path, Path]] = []
+    for test_dir in test_dirs:
+        try:
+            with os.scandir(test_dir) as entries:
+                tf_files.extend(
+                    (test_dir, test_dir / entry.name)
+                    for entry in entries
+                    if entry.name.endswith(".tf") and entry.is_file()
+                )
+        except OSError:
+            continue
+    return tf_files
+
+
+@lru_cache(maxsize=2048)
+def _extract_providers_cached(content: str) -> frozenset[tuple[str, str]]:
+    """Extract provider requirements from .tf content, memoized on the content itself.
+
+    Conformance suites repeat the same providers.tf stanza across many test
+    directories, so identical files only pay for the regex work once.
+    """
+    providers: set[tuple[str, str]] = set()
+
+    # Match required_providers block content
+    terraform_matches = _find_required_providers_blocks(content)
+
+    for match in terraform_matches:
+        # Find provider name and extract everything between braces
+        provider_match = _RE_PROVIDER_ENTRY.search(match.strip())
+
+        if provider_match:
+            provider_name = provider_match.group(1)
+            provider_content = provider_match.group(2)
+
+            # Extract source
+            source_match = _RE_SOURCE.search(provider_content)
+            if source_match:
+                source = source_match.group(1)
+
+                # Skip local providers - they can't be downloaded from registries
+                if source.startswith("local/"):
+                    continue
+
+                # Extract version (optional)
+                version_match = _RE_VERSION.search(provider_content)
+                version = version_match.group(1) if version_match else ">= 0.0.0"
+
+                providers.add((source, version))
+
+    # Only look for legacy provider syntax if we didn't find any in required_providers
+    # AND if we're scanning files that don't have terraform blocks with required_providers
+    if not providers and "required_providers" not in content:
+        legacy_matches = _RE_LEGACY.findall(content)
+        for provider_name in legacy_matches:
+            # For legacy syntax, assume hashicorp namespace if no explicit source
+            source = f"hashicorp/{provider_name}" if "/" not in provider_name else provider_name
+            providers.add((source, ">= 0.0.0"))
+
+    return frozenset(providers)
 
 
 class StirRuntime:
@@ -31,6 +139,10 @@ class StirRuntime:
         self.plugin_cache_dir = plugin_cache_dir or self._default_plugin_cache_dir()
         self.environment_vars: dict[str, str] = {}
         self._provider_cache_ready = False
+        # Built on first use (after providers are prepared) and shared by every command
+        self._base_env: dict[str, str] | None = None
+        # Caps concurrent terraform process spawns to avoid a fork storm on large runs
+        self.spawn_semaphore = asyncio.Semaphore(max(1, (os.cpu_count() or 1) - 2))
 
     def _default_plugin_cache_dir(self) -> Path:
         """Get the default plugin cache directory."""
@@ -43,36 +155,30 @@ class StirRuntime:
         Args:
             test_dirs: List of test directories to scan for provider requirements
         """
-        from tofusoup.stir.display import test_statuses
+        from tofusoup.stir.display import set_status, update_status
+        from tofusoup.stir.terraform import ensure_dir
 
         # Add a special entry for provider preparation phase
-        test_statuses["__PROVIDER_PREP__"] = {
-            "text": "SCANNING",
-            "style": "blue",
-            "active": True,
-            "success": False,
-            "skipped": False,
-            "start_time": None,
-            "end_time": None,
-            "last_log": "Scanning test directories for provider requirements...",
-            "outputs": 0,
-            "has_warnings": False,
-            "providers": 0,
-            "resources": 0,
-            "data_sources": 0,
-            "functions": 0,
-            "ephemeral_functions": 0,
-        }
+        set_status(
+            "__PROVIDER_PREP__",
+            TestStatus(
+                text="SCANNING",
+                style="blue",
+                active=True,
+                last_log="Scanning test directories for provider requirements...",
+            ),
+        )
 
         # Ensure plugin cache directory exists
-        self.plugin_cache_dir.mkdir(parents=True, exist_ok=True)
+        ensure_dir(self.plugin_cache_dir)
 
         # Find all unique providers needed across all test directories
-        test_statuses["__PROVIDER_PREP__"]["last_log"] = "Scanning test directories..."
+        update_status("__PROVIDER_PREP__", last_log="Scanning test directories...")
         required_providers = await self._scan_provider_requirements(test_dirs)
 
         if not required_providers:
-            test_statuses["__PROVIDER_PREP__"].update(
+            update_status(
+                "__PROVIDER_PREP__",
                 text="SKIPPED",
                 style="dim yellow",
                 active=False,
@@ -85,16 +191,18 @@ class StirRuntime:
         # Deduplicate providers by source, preferring higher versions
         deduplicated_providers = self._deduplicate_providers(required_providers)
 
-        test_statuses["__PROVIDER_PREP__"]["providers"] = len(deduplicated_providers)
-        test_statuses["__PROVIDER_PREP__"]["last_log"] = (
-            f"Downloading {len(deduplicated_providers)} providers..."
+        update_status(
+            "__PROVIDER_PREP__",
+            providers=len(deduplicated_providers),
+            last_log=f"Downloading {len(deduplicated_providers)} providers...",
         )
 
         # Create a temporary manifest to download all providers
         await self._download_providers(deduplicated_providers)
 
         self._provider_cache_ready = True
-        test_statuses["__PROVIDER_PREP__"].update(
+        update_status(
+            "__PROVIDER_PREP__",
             text="COMPLETE",
             style="bold green",
             active=False,
@@ -109,21 +217,23 @@ class StirRuntime:
         Returns:
             Set of (source, version_constraint) tuples
         """
-        providers = set()
-
-        for test_dir in test_dirs:
-            tf_files = list(test_dir.glob("*.tf"))
-            for tf_file in tf_files:
-                try:
-                    content = tf_file.read_text(encoding="utf-8")
-                    dir_providers = self._extract_providers_from_content(content)
-                    providers.update(dir_providers)
-                except Exception as e:
-                    console.log(f"[{test_dir.name}] Warning: Could not read {tf_file.name}: {e}")
+        tf_files = await asyncio.to_thread(_collect_tf_files, test_dirs)
+        # Overlap the file reads instead of blocking the event loop on each one in turn
+        contents = await asyncio.gather(
+            *(asyncio.to_thread(tf_file.read_text, encoding="utf-8") for _, tf_file in tf_files),
+            return_exceptions=True,
+        )
+
+        providers: set[tuple[str, str]] = set()
+        for (test_dir, tf_file), content in zip(tf_files, contents, strict=True):
+            if isinstance(content, BaseException):
+                console.log(f"[{test_dir.name}] Warning: Could not read {tf_file.name}: {content}")
+                continue
+            providers.update(self._extract_providers_from_content(content))
 
         return providers
 
-    def _extract_providers_from_content(self, content: str) -> set[tuple[str, str]]:
+    def _extract_providers_from_content(self, content: str) -> frozenset[tuple[str, str]]:
         """
         Extract provider requirements from Terraform configuration content.
 
@@ -133,48 +243,7 @@ class StirRuntime:
         Returns:
             Set of (source, version_constraint) tuples
         """
-        providers = set()
-
-        # Match required_providers block content
-        terraform_block_pattern = r"required_providers\s*\{([^}]*(?:\{[^}]*\}[^}]*)*)\}"
-        terraform_matches = re.findall(terraform_block_pattern, content, re.DOTALL | re.MULTILINE)
-
-        for match in terraform_matches:
-            # Find provider name and extract everything between braces
-            # Handle compact format like: pyvider = { source = "...", version = "..." }
-            provider_pattern = r"(\w+)\s*=\s*\{\s*(.+?)\s*(?:\}|$)"
-            provider_match = re.search(provider_pattern, match.strip(), re.DOTALL)
-
-            if provider_match:
-                provider_name = provider_match.group(1)
-                provider_content = provider_match.group(2)
-
-                # Extract source
-                source_match = re.search(r'source\s*=\s*"([^"]+)"', provider_content)
-                if source_match:
-                    source = source_match.group(1)
-
-                    # Skip local providers - they can't be downloaded from registries
-                    if source.startswith("local/"):
-                        continue
-
-                    # Extract version (optional)
-                    version_match = re.search(r'version\s*=\s*"([^"]+)"', provider_content)
-                    version = version_match.group(1) if version_match else ">= 0.0.0"
-
-                    providers.add((source, version))
-
-        # Only look for legacy provider syntax if we didn't find any in required_providers
-        # AND if we're scanning files that don't have terraform blocks with required_providers
-        if not providers and "required_providers" not in content:
-            legacy_pattern = r'provider\s+"([^"]+)"\s*\{'
-            legacy_matches = re.findall(legacy_pattern, content)
-            for provider_name in legacy_matches:
-                # For legacy syntax, assume hashicorp namespace if no explicit source
-                source = f"hashicorp/{provider_name}" if "/" not in provider_name else provider_name
-                providers.add((source, ">= 0.0.0"))
-
-        return providers
+        return _extract_providers_cached(content)
 
     def _deduplicate_providers(self, providers: set[tuple[str, str]]) -> set[tuple[str, str]]:
         """
@@ -186,23 +255,17 @@ class StirRuntime:
         Returns:
             Deduplicated set of providers
         """
-        # Group by source
-        by_source: dict[str, list[str]] = {}
+        # Single pass: per source, keep the first version seen until a specific one shows up.
+        # If we have ">= 0.0.0", prefer specific versions; use the first specific version found
+        # (they should all be the same for real projects)
+        best: dict[str, tuple[bool, str]] = {}
         for source, version in providers:
-            if source not in by_source:
-                by_source[source] = []
-            by_source[source].append(version)
+            is_specific = not version.startswith(">=")
+            current = best.get(source)
+            if current is None or (is_specific and not current[0]):
+                best[source] = (is_specific, version)
 
-        # For each source, pick the best version constraint
-        result = set()
-        for source, versions in by_source.items():
-            # If we have ">= 0.0.0", prefer specific versions
-            specific_versions = [v for v in versions if not v.startswith(">=")]
-            # Use the first specific version found (they should all be the same for real projects)
-            version = specific_versions[0] if specific_versions else versions[0]
-            result.add((source, version))
-
-        return result
+        return {(source, version) for source, (_, version) in best.items()}
 
     async def _download_providers(self, providers: set[tuple[str, str]]) -> None:
         """
@@ -218,7 +281,9 @@ class StirRuntime:
         if not providers:
             return
 
-        from tofusoup.stir.display import test_statuses
+        import tempfile
+
+        from tofusoup.stir.display import update_status
 
         # Create temporary directory for provider manifest (auto-cleaned on context exit)
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -232,9 +297,10 @@ class StirRuntime:
             # Run terraform init to download providers
             from tofusoup.stir.terraform import run_terraform_command
 
-            test_statuses["__PROVIDER_PREP__"]["text"] = "DOWNLOADING"
-            test_statuses["__PROVIDER_PREP__"]["last_log"] = (
-                f"Running terraform init to download {len(providers)} providers..."
+            update_status(
+                "__PROVIDER_PREP__",
+                text="DOWNLOADING",
+                last_log=f"Running terraform init to download {len(providers)} providers...",
             )
 
             init_args = ["init", "-no-color", "-input=false"]
@@ -253,7 +319,8 @@ class StirRuntime:
                 stdout_content = stdout_log.read_text() if stdout_log.exists() else "No stdout"
                 stderr_content = stderr_log.read_text() if stderr_log.exists() else "No stderr"
 
-                test_statuses["__PROVIDER_PREP__"].update(
+                update_status(
+                    "__PROVIDER_PREP__",
                     text="ERROR",
                     style="bold red",
                     active=False,
@@ -276,22 +343,22 @@ class StirRuntime:
         Returns:
             Terraform configuration string
         """
-        lines = ["terraform {", "  required_providers {"]
+        parts = ["terraform {\n  required_providers {\n"]
 
         for i, (source, version) in enumerate(sorted(providers)):
             # Extract provider name from source (e.g., "hashicorp/aws" -> "aws")
-            provider_name = source.split("/")[-1]
+            provider_name = source.rpartition("/")[2]
             # Ensure unique names in case of conflicts - use dashes instead of underscores
             provider_key = f"{provider_name}-{i}" if i > 0 else provider_name
 
-            lines.append(f"    {provider_key} = {{")
-            lines.append(f'      source  = "{source}"')
-            lines.append(f'      version = "{version}"')
-            lines.append("    }")
+            # One formatted block per provider rather than four separate appends
+            parts.append(
+                f'    {provider_key} = {{\n      source  = "{source}"\n      version = "{version}"\n    }}\n'
+            )
 
-        lines.extend(["  }", "}"])
+        parts.append("  }\n}")
 
-        return "\n".join(lines)
+        return "".join(parts)
 
     def get_terraform_env(self, base_env: dict[str, str]) -> dict[str, str]:
         """
@@ -313,11 +380,37 @@ class StirRuntime:
 
         return env
 
+    def get_command_env(self, tf_data_dir: Path, tf_log_path: Path) -> dict[str, str]:
+        """
+        Get the environment for a single terraform command.
+
+        The base environment is built once per runtime; each call only layers the
+        per-command paths onto a shallow copy of it.
+
+        Args:
+            tf_data_dir: TF_DATA_DIR for this command
+            tf_log_path: TF_LOG_PATH for this command
+
+        Returns:
+            Environment variables dict for terraform execution
+        """
+        if self._base_env is None:
+            self._base_env = self.get_terraform_env(base_terraform_env())
+        return {
+            **self._base_env,
+            ENV_VARS["TF_DATA_DIR"]: str(tf_data_dir),
+            "TF_LOG_PATH": str(tf_log_path),
+        }
+
     @property
     def providers_ready(self) -> bool:
         """Check if providers have been prepared."""
         return self._provider_cache_ready
 
+    def mark_providers_ready(self) -> None:
+        """Mark providers as prepared by another runtime (e.g. a sharding coordinator)."""
+        self._provider_cache_ready = True
+
     def validate_ready(self) -> None:
         """Validate that the runtime is ready for test execution."""
         if not self._provider_cache_ready:
@@ -0,0 +1,159 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Process-level sharding for large stir test suites.
+
+A single asyncio event loop handles terraform I/O concurrency well, but past a few
+hundred tests the Python-side orchestration (scheduling, subprocess spawning, status
+bookkeeping) becomes the bottleneck. Sharding partitions the discovered test
+directories across independent child processes, each running its own event loop,
+and merges their results back in the coordinator.
+"""
+
+from collections.abc import Sequence
+import json
+import multiprocessing
+from pathlib import Path
+import tempfile
+from typing import Any
+
+from attrs import asdict
+
+from tofusoup.stir.display import set_phase
+from tofusoup.stir.models import TestResult
+from tofusoup.stir.runtime import StirRuntime
+
+# Result fields that hold paths and need str <-> Path conversion across the JSON boundary
+_PATH_FIELDS = ("stdout_log_path", "stderr_log_path", "tf_log_path")
+
+
+def should_shard(test_count: int, shards: int) -> bool:
+    """Return True if the suite is large enough to benefit from sharding.
+
+    Each shard pays the cost of a fresh interpreter, so sharding only kicks in when
+    every shard gets more than two tests.
+    """
+    return shards > 1 and test_count > 2 * shards
+
+
+def partition_tests(test_dirs: list[Path], shards: int) -> list[list[Path]]:
+    """Partition test directories evenly into at most `shards` non-empty chunks.
+
+    Uses round-robin striding so that neighbouring (often similarly sized) test
+    suites land in different shards.
+    """
+    return [chunk for chunk in (test_dirs[i::shards] for i in range(shards)) if chunk]
+
+
+def result_to_dict(result: TestResult | BaseException) -> dict[str, Any]:
+    """Convert a test result (or runner exception) into a JSON-serializable dict."""
+    if not isinstance(result, TestResult):
+        return {"error": f"{type(result).__name__}: {result}"}
+
+    data = asdict(result, recurse=False)
+    for field in _PATH_FIELDS:
+        if data[field] is not None:
+            data[field] = str(data[field])
+    return data
+
+
+def result_from_dict(data: dict[str, Any]) -> TestResult | BaseException:
+    """Rebuild a test result (or runner exception) from its serialized dict."""
+    if "error" in data:
+        return RuntimeError(data["error"])
+
+    for field in _PATH_FIELDS:
+        if data.get(field) is not None:
+            data[field] = Path(data[field])
+    return TestResult(**data)
+
+
+def _run_shard(test_dirs: list[Path], plugin_cache_dir: Path, force_upgrade: bool, output_path: Path) -> None:
+    """Child process entry point: run one shard and write its results as JSON.
+
+    Providers are prepared once by the coordinator before the shards start, so the
+    child runtime skips preparation to avoid concurrent writes to the plugin cache.
+    """
+    from tofusoup.stir.executor import execute_tests, initialize_tests, run_coroutine
+
+    runtime = StirRuntime(plugin_cache_dir=plugin_cache_dir, force_upgrade=force_upgrade)
+    runtime.mark_providers_ready()
+    initialize_tests(test_dirs)
+
+    results = run_coroutine(execute_tests(test_dirs, runtime))
+    output_path.write_text(json.dumps([result_to_dict(r) for r in results]), encoding="utf-8")
+
+
+def run_shards(test_dirs: list[Path], runtime: StirRuntime, shards: int) -> list[TestResult | BaseException]:
+    """Run test directories across `shards` spawned child processes and merge results.
+
+    Blocks until every shard has exited. A shard that dies without writing its
+    results contributes one runner error instead of silently dropping its tests.
+    """
+    partitions = partition_tests(test_dirs, shards)
+    ctx = multiprocessing.get_context("spawn")
+    results: list[TestResult | BaseException] = []
+
+    with tempfile.TemporaryDirectory(prefix="stir-shards-") as temp_dir:
+        output_paths = [Path(temp_dir) / f"shard-{i}.json" for i in range(len(partitions))]
+        processes = [
+            ctx.Process(
+                target=_run_shard,
+                args=(partition, runtime.plugin_cache_dir, runtime.force_upgrade, output_path),
+                name=f"stir-shard-{i}",
+            )
+            for i, (partition, output_path) in enumerate(zip(partitions, output_paths, strict=True))
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        for process, output_path in zip(processes, output_paths, strict=True):
+            if process.exitcode != 0 or not output_path.exists():
+                results.append(RuntimeError(f"{process.name} exited with code {process.exitcode}"))
+                continue
+            results.extend(result_from_dict(d) for d in json.loads(output_path.read_text(encoding="utf-8")))
+
+    return results
+
+
+def record_results(results: Sequence[TestResult | BaseException]) -> None:
+    """Fold merged shard results into the coordinator's status table.
+
+    Shards run without a live display, so the coordinator renders a single merged
+    table once all shards have finished.
+    """
+    for result in results:
+        if not isinstance(result, TestResult):
+            continue
+        phase = "SKIPPED" if result.skipped else "PASS" if result.success else "FAIL"
+        set_phase(
+            result.directory,
+            phase,
+            success=result.success,
+            skipped=result.skipped,
+            start_time=result.start_time,
+            end_time=result.end_time,
+            outputs=result.outputs,
+            has_warnings=result.has_warnings,
+            providers=result.providers,
+            resources=result.resources,
+            data_sources=result.data_sources,
+            functions=result.functions,
+            ephemeral_functions=result.ephemeral_functions,
+        )
+
+
+__all__ = [
+    "partition_tests",
+    "record_results",
+    "result_from_dict",
+    "result_to_dict",
+    "run_shards",
+    "should_shard",
+]
+
+# 🥣🔬🔚
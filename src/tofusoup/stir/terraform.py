@@ -5,50 +5,199 @@
 
 
 import asyncio
+from collections.abc import Iterator
 import contextlib
-from datetime import UTC, datetime
-import json
 import os
 from pathlib import Path
 import re
 import sys
+from time import monotonic
 from typing import Any
 
+from tofusoup.common.serialization import fast_json_loads
 from tofusoup.stir.config import ENV_VARS, LOGS_DIR, TF_COMMAND
-from tofusoup.stir.display import console, test_statuses
-from tofusoup.stir.runtime import StirRuntime
+from tofusoup.stir.display import console, mark_dirty, test_statuses, update_status
+from tofusoup.stir.runtime import StirRuntime, base_terraform_env
 
 # Debouncing: Track last update time per test to reduce display churn
 _last_update_times: dict[str, float] = {}
 _UPDATE_DEBOUNCE_INTERVAL = 0.5  # Only update display every 0.5 seconds
-
-
-async def _tail_tf_log(log_path: Path, process: asyncio.subprocess.Process, dir_name: str) -> None:
-    """Asynchronously tails the Terraform JSON log file to update the UI in real-time."""
+_TAIL_READ_SIZE = 65536
+_LOG_READ_CHUNK_SIZE = 1 << 20
+
+# Directories already created by this process, so repeated commands skip the mkdir syscalls
+_ensured_dirs: set[str] = set()
+# Latest (message, level, error_field, module) held back by the debounce; its semantic message
+# is only extracted when tailing finishes, so debounced lines never pay for the regex work
+_pending_last_logs: dict[str, tuple[str, str, str | None, str | None]] = {}
+
+# Patterns used on every tailed log line, compiled once at import
+_RE_RESOURCE_ADDRESS = re.compile(r"(\w+\.\w+\.\w+)")
+_RE_DATA_SOURCE_ADDRESS = re.compile(r"(data\.\w+\.\w+)")
+_RE_PROVIDER_INSTALL = re.compile(r"registry[^/]*/([^/]+/[^\s]+)\s+v?([\d.]+)")
+_RE_APPLY_COMPLETE = re.compile(r"(\d+)\s+added")
+
+# Characters replaced in log file names; str.translate maps them in a single C-level pass
+_UNSAFE_FILENAME_CHARS = str.maketrans(dict.fromkeys("\\/.:", "_"))
+
+# Semantic message dispatch: one alternation whose group name says which kind of line matched.
+# Resource operation groups are named after the operation shown in the status table.
+_RESOURCE_OPERATIONS = frozenset({"Creating", "Reading", "Updating", "Destroying"})
+_RE_SEMANTIC_DISPATCH = re.compile(
+    r"(?P<Creating>Creating\.\.\.|Creating resource)"
+    r"|(?P<Reading>Reading\.\.\.|Reading data)"
+    r"|(?P<Updating>Modifying\.\.\.|Updating resource)"
+    r"|(?P<Destroying>Destroying\.\.\.|Destroying resource)"
+    r"|(?P<install>Installing)"
+    r"|(?P<applied>Apply complete!)"
+    r"|(?P<info>OpenTofu version:|Terraform version:|Initializing|Terraform has been successfully initialized)"
+)
+
+
+async def _tail_tf_log(
+    log_path: Path, process: asyncio.subprocess.Process, dir_name: str
+) -> list[dict[str, Any]] | None:
+    """Asynchronously tails the Terraform JSON log file to update the UI in real-time.
+
+    Returns every log entry parsed along the way, or None if tailing failed and the
+    caller needs to parse the log itself.
+    """
     try:
         await _wait_for_log_file(log_path, process)
-        await _process_log_file(log_path, process, dir_name)
+        if not os.path.exists(log_path):  # noqa: PTH110
+            return None
+        return await _process_log_file(log_path, process, dir_name)
     except Exception as e:
         console.log(f"[{dir_name}] Error tailing log: {e}")
+        return None
+    finally:
+        _flush_pending_last_log(dir_name)
+
+
+def _flush_pending_last_log(dir_name: str) -> None:
+    """Write the last debounced message so the final line is always displayed."""
+    pending = _pending_last_logs.pop(dir_name, None)
+    if pending is None:
+        return
+    message, level, error_field, module = pending
+    semantic_message = _extract_semantic_message(message, level, error_field=error_field, module=module)
+    if semantic_message:
+        update_status(dir_name, last_log=semantic_message)
 
 
 async def _wait_for_log_file(log_path: Path, process: asyncio.subprocess.Process) -> None:
-    """Wait for log file to be created."""
-    while not await asyncio.to_thread(log_path.exists):
+    """Wait for log file to be created.
+
+    A single stat is far cheaper than a thread-pool hop, so it runs inline on the loop;
+    N parallel tests waiting here no longer tie up to_thread workers.
+    """
+    log_file = os.fspath(log_path)
+    while not os.path.exists(log_file):  # noqa: PTH110
         if process.returncode is not None:
             return
         await asyncio.sleep(0.1)
 
 
-async def _process_log_file(log_path: Path, process: asyncio.subprocess.Process, dir_name: str) -> None:
-    """Process log file entries and update test status."""
-    with log_path.open(encoding="utf-8") as f:
-        while process.returncode is None:
-            line = f.readline()
-            if line:
-                _process_log_line(line, dir_name)
-            else:
+async def _process_log_file(
+    log_path: Path, process: asyncio.subprocess.Process, dir_name: str
+) -> list[dict[str, Any]]:
+    """Process log file entries, update test status, and return the parsed entries.
+
+    Reads whatever bytes are available in 64 KiB chunks and splits them into lines,
+    carrying an incomplete trailing line over to the next read. Once the process has
+    exited the rest of the file is drained, so the result covers the whole log.
+    """
+    parsed_logs: list[dict[str, Any]] = []
+    fd = os.open(log_path, os.O_RDONLY)
+    partial = b""
+    try:
+        while True:
+            chunk = os.read(fd, _TAIL_READ_SIZE)
+            if not chunk:
+                if process.returncode is not None:
+                    break
                 await asyncio.sleep(0.1)
+                continue
+            *lines, partial = (partial + chunk).split(b"\n")
+            for line in lines:
+                if line:
+                    _process_log_line(line, dir_name, parsed_logs)
+        if partial:
+            _process_log_line(partial, dir_name, parsed_logs)
+    finally:
+        os.close(fd)
+    return parsed_logs
+
+
+# Provider-specific noise patterns
+_PROVIDER_NOISE_PATTERNS = (
+    "Creating new self-signed",
+    "Creating Unix socket at",
+    "No existing schema future found",
+    "Provider server has shut down gracefully",
+    "Reading environment variables",
+)
+
+# Internal protocol noise patterns
+_NOISE_PATTERNS = (
+    "configuring client automatic mTLS",
+    "plugin failed to exit gracefully",  # Benign - provider shuts down properly but TF is impatient
+    "plugin process exited",
+    "GRPCProvider.v6:",
+    "GRPCProvider6:",
+    "statemgr.Filesystem:",
+    "Meta.Backend:",
+    "backend/local:",
+    "providercache.Dir.",
+    "Stdout is not a terminal",
+    "Stderr is not a terminal",
+    "Stdin is a terminal",
+    "checking for provisioner in",
+    "checking for credentials in",
+    "ignoring non-existing provider search directory",
+    "will search for provider plugins in",
+    "using github.com/",
+    "CLI args:",
+    "CLI command args:",
+    "Go runtime version:",
+    "Found the config directory:",
+    "Attempting to open CLI config file:",
+    "Loading CLI configuration from",
+    "Attempting to acquire global provider lock",
+    "Releasing global provider lock",
+    "OpenTelemetry: OTEL_TRACES_EXPORTER not set",
+    "HTTP client GET request to",
+    "New state was assigned lineage",
+)
+
+
+def _trie_regex(patterns: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile literal patterns into one regex shaped like their prefix trie.
+
+    Shared prefixes ("Attempting to ", "checking for ", "GRPCProvider") are matched once
+    instead of once per alternative, so each scan position costs a single trie walk.
+    """
+    trie: dict[str, Any] = {}
+    for pattern in patterns:
+        node = trie
+        for char in pattern:
+            node = node.setdefault(char, {})
+        node[""] = {}  # end-of-pattern marker
+
+    def emit(node: dict[str, Any]) -> str:
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        is_end = "" in node
+        body = branches[0] if len(branches) == 1 and not is_end else f"(?:{'|'.join(branches)})"
+        return f"{body}?" if is_end else body
+
+    return re.compile(emit(trie))
+
+
+# Each pattern list folded into one trie-shaped regex, so a line is scanned once rather than once per pattern
+_PROVIDER_NOISE_RE = _trie_regex(_PROVIDER_NOISE_PATTERNS)
+_NOISE_RE = _trie_regex(_NOISE_PATTERNS)
 
 
 def _should_filter_message(message: str, level: str, module: str | None = None) -> bool:
@@ -65,62 +214,22 @@ def _should_filter_message(message: str, level: str, module: str | None = None)
         return True
 
     # Filter provider-internal messages by module
-    if module and "provider" in module:
-        # Provider-specific noise patterns
-        provider_noise = [
-            "Creating new self-signed",
-            "Creating Unix socket at",
-            "No existing schema future found",
-            "Provider server has shut down gracefully",
-            "Reading environment variables",
-        ]
-        if any(pattern in message for pattern in provider_noise):
-            return True
+    if module and "provider" in module and _PROVIDER_NOISE_RE.search(message):
+        return True
 
     # Filter out internal protocol noise
-    noise_patterns = [
-        "configuring client automatic mTLS",
-        "plugin failed to exit gracefully",  # Benign - provider shuts down properly but TF is impatient
-        "plugin process exited",
-        "GRPCProvider.v6:",
-        "GRPCProvider6:",
-        "statemgr.Filesystem:",
-        "Meta.Backend:",
-        "backend/local:",
-        "providercache.Dir.",
-        "Stdout is not a terminal",
-        "Stderr is not a terminal",
-        "Stdin is a terminal",
-        "checking for provisioner in",
-        "checking for credentials in",
-        "ignoring non-existing provider search directory",
-        "will search for provider plugins in",
-        "using github.com/",
-        "CLI args:",
-        "CLI command args:",
-        "Go runtime version:",
-        "Found the config directory:",
-        "Attempting to open CLI config file:",
-        "Loading CLI configuration from",
-        "Attempting to acquire global provider lock",
-        "Releasing global provider lock",
-        "OpenTelemetry: OTEL_TRACES_EXPORTER not set",
-        "HTTP client GET request to",
-        "New state was assigned lineage",
-    ]
-
-    return any(pattern in message for pattern in noise_patterns)
+    return _NOISE_RE.search(message) is not None
 
 
 def _extract_resource_operation(message: str, operation: str) -> str | None:
     """Extract resource name from an operation message."""
     # Resource pattern: resource_type.resource_name
-    match = re.search(r"(\w+\.\w+\.\w+)", message)
+    match = _RE_RESOURCE_ADDRESS.search(message)
     if match:
         return f"{operation} {match.group(1)}"
 
     # Data source pattern: data.data_type.data_name
-    match = re.search(r"(data\.\w+\.\w+)", message)
+    match = _RE_DATA_SOURCE_ADDRESS.search(message)
     if match:
         return f"{operation} {match.group(1)}"
 
@@ -129,7 +238,7 @@ def _extract_resource_operation(message: str, operation: str) -> str | None:
 
 def _extract_provider_install(message: str) -> str | None:
     """Extract provider installation info from message."""
-    match = re.search(r"registry[^/]*/([^/]+/[^\s]+)\s+v?([\d.]+)", message)
+    match = _RE_PROVIDER_INSTALL.search(message)
     if match:
         return f"Installing {match.group(1)} v{match.group(2)}"
     return None
@@ -137,7 +246,7 @@ def _extract_provider_install(message: str) -> str | None:
 
 def _extract_apply_complete(message: str) -> str | None:
     """Extract resource count from apply complete message."""
-    match = re.search(r"(\d+)\s+added", message)
+    match = _RE_APPLY_COMPLETE.search(message)
     if match:
         return f"Applied {match.group(1)} resources"
     return None
@@ -172,93 +281,151 @@ def _extract_semantic_message(
     if level in ("error", "warn"):
         return _format_error_message(level, error_field, message)
 
-    # Resource operations
-    if "Creating..." in message or "Creating resource" in message:
-        return _extract_resource_operation(message, "Creating")
+    # One scan classifies the line; matches are visited left to right
+    for match in _RE_SEMANTIC_DISPATCH.finditer(message):
+        kind = match.lastgroup
+        if kind in _RESOURCE_OPERATIONS:
+            # Resource operations
+            return _extract_resource_operation(message, kind)
+        if kind == "install":
+            # Provider installation
+            if "provider" in message or "registry" in message:
+                return _extract_provider_install(message)
+        elif kind == "applied":
+            # Plan/Apply completion
+            return _extract_apply_complete(message)
+        else:
+            # Info messages that provide value
+            return message
 
-    if "Reading..." in message or "Reading data" in message:
-        return _extract_resource_operation(message, "Reading")
+    return None
 
-    if "Modifying..." in message or "Updating resource" in message:
-        return _extract_resource_operation(message, "Updating")
 
-    if "Destroying..." in message or "Destroying resource" in message:
-        return _extract_resource_operation(message, "Destroying")
+def _loads_log_line(line: bytes) -> Any:
+    """Parse one JSON log line, or return None if it isn't valid JSON.
 
-    # Provider installation
-    if "Installing" in message and ("provider" in message or "registry" in message):
-        return _extract_provider_install(message)
+    Lines that only fail because of invalid UTF-8 are re-parsed with the bad bytes
+    replaced, so they are still shown rather than dropped.
+    """
+    try:
+        return fast_json_loads(line)
+    except ValueError:
+        try:
+            text = line.decode("utf-8")
+        except UnicodeDecodeError:
+            text = line.decode("utf-8", errors="replace")
+        else:
+            return None  # Valid UTF-8, so the JSON itself is broken
+    try:
+        return fast_json_loads(text)
+    except ValueError:
+        return None
+
+
+def _process_log_line(line: bytes, dir_name: str, parsed_logs: list[dict[str, Any]] | None = None) -> None:
+    """Process a single log line and update status, collecting the entry into parsed_logs."""
+    # Cheap shape check first, so blank, partial or non-JSON lines return without raising
+    line = line.strip()
+    if not line.startswith(b"{") or not line.endswith(b"}"):
+        return
+    log_entry = _loads_log_line(line)
+    if log_entry is None:
+        return
+    if parsed_logs is not None:
+        parsed_logs.append(log_entry)
+    level = log_entry.get("@level", "info")
+    message = log_entry.get("@message", "")
+    module = log_entry.get("@module")  # Extract module field
+    error_field = log_entry.get("error")  # Extract structured error field
+    # Note: @timestamp available in log_entry for future timing analysis
+
+    if not message:
+        return
+
+    # Filter out noise (now with module awareness)
+    if _should_filter_message(message, level, module):
+        # Still track function counts even if we don't show the message
+        _update_function_counts(message, dir_name)
+        return
 
-    # Plan/Apply completion
-    if "Apply complete!" in message:
-        return _extract_apply_complete(message)
+    # Debouncing: decide before extracting, so lines inside the window skip the regex work.
+    # Always show errors/warnings immediately, debounce info messages
+    current_time = monotonic()
+    is_important = level in ("error", "warn")
+    if is_important or (current_time - _last_update_times.get(dir_name, 0)) >= _UPDATE_DEBOUNCE_INTERVAL:
+        # Extract semantic meaning (now with error field and module)
+        semantic_message = _extract_semantic_message(message, level, error_field=error_field, module=module)
+        if semantic_message:
+            update_status(dir_name, last_log=semantic_message)
+            _last_update_times[dir_name] = current_time
+            _pending_last_logs.pop(dir_name, None)
+    else:
+        _pending_last_logs[dir_name] = (message, level, error_field, module)
 
-    # Info messages that provide value
-    valuable_info_patterns = [
-        "OpenTofu version:",
-        "Terraform version:",
-        "Initializing",
-        "Terraform has been successfully initialized",
-    ]
+    if level == "warn":
+        update_status(dir_name, has_warnings=True)
 
-    for pattern in valuable_info_patterns:
-        if pattern in message:
-            return message
+    _update_function_counts(message, dir_name)
 
-    return None
 
+def _update_function_counts(message: str, dir_name: str) -> None:
+    """Update function call counts from log message."""
+    if "CallFunction" in message and "GRPCProvider" in message:
+        # Counted on the slotted status object directly, without building an update dict
+        status = test_statuses[dir_name]
+        if "ephemeral" in message:
+            status.ephemeral_functions += 1
+        else:
+            status.functions += 1
+        mark_dirty(dir_name)
 
-def _process_log_line(line: str, dir_name: str) -> None:
-    """Process a single log line and update status."""
-    from time import monotonic
 
-    try:
-        log_entry = json.loads(line)
-        level = log_entry.get("@level", "info")
-        message = log_entry.get("@message", "")
-        module = log_entry.get("@module")  # Extract module field
-        error_field = log_entry.get("error")  # Extract structured error field
-        # Note: @timestamp available in log_entry for future timing analysis
-
-        if not message:
-            return
+def ensure_dir(path: str | os.PathLike[str]) -> None:
+    """Create a directory (and its parents) at most once per process."""
+    path_str = os.fspath(path)
+    if path_str not in _ensured_dirs:
+        os.makedirs(path_str, exist_ok=True)  # noqa: PTH103
+        _ensured_dirs.add(path_str)
 
-        # Filter out noise (now with module awareness)
-        if _should_filter_message(message, level, module):
-            # Still track function counts even if we don't show the message
-            _update_function_counts(message, dir_name)
-            return
 
-        # Extract semantic meaning (now with error field and module)
-        semantic_message = _extract_semantic_message(message, level, error_field, module)
+def forget_ensured_dirs(root: str | os.PathLike[str]) -> None:
+    """Forget memoized directories under root after it was cleaned, so they get recreated."""
+    prefix = os.path.join(os.fspath(root), "")  # noqa: PTH118
+    _ensured_dirs.difference_update([d for d in _ensured_dirs if d.startswith(prefix)])
 
-        if semantic_message:
-            # Debouncing: Only update display if enough time has passed
-            current_time = monotonic()
-            last_update = _last_update_times.get(dir_name, 0)
 
-            # Always show errors/warnings immediately, debounce info messages
-            is_important = level in ("error", "warn")
+def _iter_log_lines(tf_log_path: Path) -> Iterator[bytes]:
+    """Yield the raw lines of a log file, reading it in 1 MiB chunks."""
+    partial = b""
+    with tf_log_path.open("rb") as f:
+        while chunk := f.read(_LOG_READ_CHUNK_SIZE):
+            *lines, partial = (partial + chunk).split(b"\n")
+            yield from lines
+    if partial:
+        yield partial
 
-            if is_important or (current_time - last_update) >= _UPDATE_DEBOUNCE_INTERVAL:
-                test_statuses[dir_name]["last_log"] = semantic_message
-                _last_update_times[dir_name] = current_time
 
-        if level == "warn":
-            test_statuses[dir_name]["has_warnings"] = True
+def _iter_log_entries(tf_log_path: Path) -> Iterator[dict[str, Any]]:
+    """Yield the JSON entries of a terraform log, skipping lines that aren't valid JSON.
 
-        _update_function_counts(message, dir_name)
-    except json.JSONDecodeError:
-        pass
+    Lines stay bytes and go straight to fast_json_loads, so large logs are never
+    decoded (or held) in full; only lines with invalid UTF-8 are decoded, with replacement.
+    """
+    for raw_line in _iter_log_lines(tf_log_path):
+        # Same cheap shape check as the tailer, so non-JSON lines skip the exception path
+        line = raw_line.strip()
+        if not line.startswith(b"{") or not line.endswith(b"}"):
+            continue
+        log_entry = _loads_log_line(line)
+        if log_entry is not None:
+            yield log_entry
 
 
-def _update_function_counts(message: str, dir_name: str) -> None:
-    """Update function call counts from log message."""
-    if "CallFunction" in message and "GRPCProvider" in message:
-        if "ephemeral" in message:
-            test_statuses[dir_name]["ephemeral_functions"] += 1
-        else:
-            test_statuses[dir_name]["functions"] += 1
+def _parse_tf_log(tf_log_path: Path) -> list[dict[str, Any]]:
+    """Parse a terraform JSON log, skipping lines that aren't valid JSON."""
+    if not os.path.exists(tf_log_path):  # noqa: PTH110
+        return []
+    return list(_iter_log_entries(tf_log_path))
 
 
 async def run_terraform_command(
@@ -268,43 +435,44 @@ async def run_terraform_command(
     tail_log: bool = False,
     capture_stdout: bool = False,
     override_cache_dir: Path | None = None,
-) -> tuple[int, str, Path, Path, Path, list[dict[str, Any]]]:
+) -> tuple[int, bytes, Path, Path, Path, list[dict[str, Any]]]:
     """
     A dedicated runner for Terraform commands that sets up the correct environment,
     captures logs, and can tail the JSON log for live UI updates.
+
+    When capture_stdout is set, stdout is returned as raw bytes so JSON output
+    (e.g. `show -json`) can be parsed without an intermediate decode.
     """
+    from datetime import UTC, datetime
+
     dir_name = directory.name
     timestamp = datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
 
     soup_dir = directory / ".soup"
     tf_data_dir = soup_dir / "tfdata"
     logs_dir = soup_dir / "logs"
-    logs_dir.mkdir(parents=True, exist_ok=True)
-    tf_data_dir.mkdir(parents=True, exist_ok=True)
+    ensure_dir(logs_dir)
+    ensure_dir(tf_data_dir)
 
     tf_log_path = logs_dir / "terraform.log"
 
-    sanitized_dir_name = re.sub(r"[\\/.:]", "_", dir_name)
+    sanitized_dir_name = dir_name.translate(_UNSAFE_FILENAME_CHARS)
     cmd_basename = Path(TF_COMMAND).name
     stdout_log_path = LOGS_DIR / f"{sanitized_dir_name}.{cmd_basename}.{args[0]}.stdout.{timestamp}.log"
     stderr_log_path = LOGS_DIR / f"{sanitized_dir_name}.{cmd_basename}.{args[0]}.stderr.{timestamp}.log"
 
-    env = os.environ.copy()
-    env[ENV_VARS["TF_DATA_DIR"]] = str(tf_data_dir)
-    env[ENV_VARS["TF_LOG"]] = "JSON"
-    env["TF_LOG_PATH"] = str(tf_log_path)
-    env[ENV_VARS["PYVIDER_PRIVATE_STATE_SHARED_SECRET"]] = "stir-test-secret"
-    env["PYVIDER_TESTMODE"] = "true"
-
     # Handle provider preparation phase (runtime=None with override_cache_dir)
     if runtime is None and override_cache_dir:
         # Special case: provider preparation phase
+        env = base_terraform_env()
+        env[ENV_VARS["TF_DATA_DIR"]] = str(tf_data_dir)
+        env["TF_LOG_PATH"] = str(tf_log_path)
         if override_cache_dir.exists():
             env["TF_PLUGIN_CACHE_DIR"] = str(override_cache_dir)
             env["TF_PLUGIN_CACHE_MAY_BREAK_DEPENDENCY_LOCK_FILE"] = "1"
     elif runtime:
-        # Normal execution: use runtime-managed environment
-        env = runtime.get_terraform_env(env)
+        # Normal execution: use the runtime's cached environment
+        env = runtime.get_command_env(tf_data_dir, tf_log_path)
     else:
         # Neither runtime nor override provided
         raise RuntimeError(
@@ -319,6 +487,8 @@ async def run_terraform_command(
     tf_bin = shutil.which(TF_COMMAND) or TF_COMMAND
     command = [tf_bin, *args]
 
+    # Log entries parsed while tailing, if the command was tailed
+    tailed_logs: list[dict[str, Any]] | None = None
     if sys.platform == "win32":
         # Windows: use subprocess.run in a thread to avoid SelectorEventLoop
         # issues with asyncio.create_subprocess_exec on Python 3.11
@@ -335,13 +505,15 @@ async def run_terraform_command(
         stderr_data = result.stderr
         returncode = result.returncode
     else:
-        process = await asyncio.create_subprocess_exec(
-            *command,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            cwd=directory,
-            env=env,
-        )
+        # Only the spawn itself is gated; the process runs unthrottled once started
+        async with runtime.spawn_semaphore if runtime else contextlib.nullcontext():
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=directory,
+                env=env,
+            )
 
         tail_task = None
         if tail_log:
@@ -350,21 +522,17 @@ async def run_terraform_command(
         stdout_data, stderr_data = await process.communicate()
 
         if tail_task:
-            await tail_task
+            tailed_logs = await tail_task
 
         returncode = process.returncode
 
     stdout_log_path.write_bytes(stdout_data)
     stderr_log_path.write_bytes(stderr_data)
 
-    parsed_logs = []
-    if tf_log_path.exists():
-        with tf_log_path.open(encoding="utf-8", errors="replace") as f:
-            for line in f:
-                with contextlib.suppress(json.JSONDecodeError):
-                    parsed_logs.append(json.loads(line))
+    # The tailer already parsed every line; only read the log back if it didn't run
+    parsed_logs = tailed_logs if tailed_logs is not None else _parse_tf_log(tf_log_path)
 
-    final_stdout = stdout_data.decode("utf-8", errors="ignore") if capture_stdout else ""
+    final_stdout = stdout_data if capture_stdout else b""
     return (
         returncode or 0,  # Ensure returncode is int, not None
         final_stdout,
@@ -24,7 +24,26 @@ def _print_results_report(results: list[Any]) -> None:
     """Prints a summary table and detailed failure report."""
 
 
-@click.group("test")
+class SuiteGroup(click.Group):
+    """
+    A Click Group whose per-suite subcommands are built on first use from TEST_SUITE_CONFIG,
+    so an invocation only constructs the command it actually runs.
+    """
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """Lists the eager commands together with every configured test suite."""
+        return sorted(set(super().list_commands(ctx)) | TEST_SUITE_CONFIG.keys())
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Gets a command by name, building (and caching) suite commands on demand."""
+        cmd = super().get_command(ctx, cmd_name)
+        if cmd is None and cmd_name in TEST_SUITE_CONFIG:
+            cmd = _make_suite_command(cmd_name)
+            self.add_command(cmd)
+        return cmd
+
+
+@click.group("test", cls=SuiteGroup)
 @click.pass_context
 def test_cli(ctx: click.Context) -> None:
     """A unified command to execute various conformance test suites."""
@@ -54,18 +73,18 @@ def test_all_command(ctx: click.Context) -> None:
         sys.exit(1)
 
 
-# Dynamically create subcommands for each test suite
-for suite_name_key in TEST_SUITE_CONFIG:
-    suite_config_data = TEST_SUITE_CONFIG[suite_name_key]
+def _make_suite_command(suite_name: str) -> click.Command:
+    """Build the subcommand that runs a single test suite from TEST_SUITE_CONFIG."""
+    suite_config_data = TEST_SUITE_CONFIG[suite_name]
 
-    @test_cli.command(
-        name=suite_name_key,
+    @click.command(
+        name=suite_name,
         help=f"Runs the {suite_config_data['description']}. Pass additional options after -- for pytest.",
         context_settings=dict(ignore_unknown_options=True),
     )
     @click.argument("pytest_options", nargs=-1, type=click.UNPROCESSED)
     @click.pass_context
-    def _suite_command(ctx: click.Context, pytest_options: tuple[str, ...], snk: str = suite_name_key) -> None:
+    def _suite_command(ctx: click.Context, pytest_options: tuple[str, ...]) -> None:
         verbose = ctx.obj.get("VERBOSE", False)
         project_root = ctx.obj.get("PROJECT_ROOT")
         if not project_root:
@@ -74,12 +93,15 @@ for suite_name_key in TEST_SUITE_CONFIG:
 
         try:
             loaded_config = ctx.obj.get("TOFUSOUP_CONFIG", {})
-            asyncio.run(run_test_suite(snk, project_root, loaded_config, verbose, list(pytest_options)))
+            asyncio.run(run_test_suite(suite_name, project_root, loaded_config, verbose, list(pytest_options)))
         except TofuSoupError as e:
-            logger.error(f"Error running test suite '{snk}': {e}", exc_info=verbose)
+            logger.error(f"Error running test suite '{suite_name}': {e}", exc_info=verbose)
             sys.exit(1)
         except Exception as e:
-            logger.error(f"Unexpected error in test suite '{snk}': {e}", exc_info=verbose)
+            logger.error(f"Unexpected error in test suite '{suite_name}': {e}", exc_info=verbose)
             sys.exit(1)
 
+    return _suite_command
+
+
 # 🥣🔬🔚
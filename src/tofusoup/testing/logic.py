@@ -5,6 +5,10 @@
 
 
 import asyncio
+import functools
+import hashlib
+import importlib.metadata
+import importlib.util
 import json
 import os
 import pathlib
@@ -16,8 +20,40 @@ from provide.foundation import logger
 from provide.foundation.errors import ResourceError, ValidationError, error_boundary
 
 from tofusoup.common.exceptions import TofuSoupError
+from tofusoup.common.serialization import fast_json_loads
+from tofusoup.config.defaults import ENV_SOUP_NO_CACHE
 from tofusoup.harness.logic import ensure_go_harness_build
 
+# Optional ijson streaming - graceful fallback to parsing the whole report at once
+try:
+    import ijson  # type: ignore[import-untyped]
+
+    HAS_IJSON = True
+    _REPORT_DECODE_ERRORS: tuple[type[Exception], ...] = (ValueError, ijson.JSONError)
+except ImportError:
+    HAS_IJSON = False
+    _REPORT_DECODE_ERRORS = (ValueError,)
+
+# Optional zstandard compression of retained test reports
+try:
+    import zstandard
+
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+# Optional pytest-xdist in the test environment - suites run single-process without it
+HAS_XDIST = importlib.util.find_spec("xdist") is not None
+
+# pytest-json-report outcomes that are reported back as failures
+_FAILED_OUTCOMES = frozenset(("failed", "error"))
+
+# Per-process report file suffix, so parallel soup invocations never share a report file
+_REPORT_SUFFIX = f"-report-{os.getpid()}.json"
+
+# Report fields materialized while streaming; everything else (notably passing tests) is skipped
+_STREAMED_REPORT_PREFIXES = frozenset({"summary", "exitcode", "duration", "errors", "tests.item"})
+
 
 @attrs.define(frozen=True)
 class TestSuiteResult:
@@ -31,6 +67,162 @@ class TestSuiteResult:
     failures: list[dict[str, Any]] = attrs.field(factory=list)
 
 
+def _stream_test_report(report_file: Any) -> dict[str, Any]:
+    """Walk a pytest-json-report file incrementally with ijson.
+
+    Only the top-level fields used for the suite result are built; entries of the
+    `tests` array are built one at a time and kept only if they failed, so peak memory
+    is bounded by the failed tests rather than the whole suite.
+    """
+    report: dict[str, Any] = {"tests": []}
+    builder: Any = None
+    target = ""
+    depth = 0
+    for prefix, event, value in ijson.parse(report_file, use_float=True):
+        if builder is None:
+            if prefix not in _STREAMED_REPORT_PREFIXES:
+                continue
+            if event not in ("start_map", "start_array"):
+                report[prefix] = value
+                continue
+            builder = ijson.ObjectBuilder()
+            target = prefix
+        builder.event(event, value)
+        if event in ("start_map", "start_array"):
+            depth += 1
+        elif event in ("end_map", "end_array"):
+            depth -= 1
+            if depth == 0:
+                if target != "tests.item":
+                    report[target] = builder.value
+                elif builder.value.get("outcome") in _FAILED_OUTCOMES:
+                    report["tests"].append(builder.value)
+                builder = None
+    return report
+
+
+def _load_test_report(report_path: pathlib.Path) -> dict[str, Any]:
+    """Load the fields of a pytest-json-report file needed for a TestSuiteResult.
+
+    The returned report's `tests` holds only the failed/error entries.
+    """
+    try:
+        report_file = report_path.open("rb")
+    except FileNotFoundError as e:
+        raise ResourceError(f"Test report file not found: {report_path}") from e
+    with report_file:
+        if not report_file.peek(1):
+            raise ValidationError("Empty test report file")
+        try:
+            if HAS_IJSON:
+                return _stream_test_report(report_file)
+            # Parsed straight from bytes; orjson when installed
+            report: dict[str, Any] = fast_json_loads(report_file.read())
+        except _REPORT_DECODE_ERRORS as e:
+            # json.JSONDecodeError (and orjson's subclass of it), ijson errors, or undecodable bytes
+            raise ValidationError(f"Invalid JSON in test report: {e}") from e
+    # Same shape as the streamed report: only failed tests are kept
+    report["tests"] = [test for test in report.get("tests", ()) if test.get("outcome") in _FAILED_OUTCOMES]
+    return report
+
+
+def _compress_report(report_path: pathlib.Path) -> pathlib.Path:
+    """Replace a processed JSON report with a zstd-compressed `.json.zst` copy.
+
+    Returns the path the report is kept at. Without zstandard (or on an I/O error) the
+    JSON file is left in place. Read a compressed report back with
+    `zstandard.ZstdDecompressor().decompress(path.read_bytes())`.
+    """
+    if not HAS_ZSTD:
+        return report_path
+    compressed_path = report_path.with_suffix(".json.zst")
+    try:
+        compressed_path.write_bytes(zstandard.ZstdCompressor(level=3).compress(report_path.read_bytes()))
+        report_path.unlink()
+    except OSError as e:
+        logger.debug(f"Keeping uncompressed test report {report_path}: {e}")
+        return report_path
+    return compressed_path
+
+
+# The package under test; its sources are part of every suite's cache key
+_TOFUSOUP_SOURCE_ROOT = pathlib.Path(__file__).resolve().parent.parent
+
+# Suite files that can change a run's outcome; run artifacts (__pycache__, .pytest_cache,
+# reports) are left out so they don't invalidate the key on every run
+_SUITE_CACHE_SUFFIXES = frozenset({".py", ".feature", ".tf", ".hcl", ".json", ".toml", ".sh"})
+
+
+@functools.cache
+def _environment_fingerprint() -> str:
+    """Fingerprint the interpreter and installed distributions once per process."""
+    distributions = sorted(
+        f"{dist.metadata['Name']}=={dist.version}" for dist in importlib.metadata.distributions()
+    )
+    return repr((sys.version, sys.executable, distributions))
+
+
+def _suite_cache_key(
+    suite_name: str,
+    *,
+    project_root: pathlib.Path,
+    suite_path_relative: str,
+    pytest_args: list[str],
+    env_vars: dict[str, Any],
+    harness_paths: list[pathlib.Path],
+) -> str:
+    """Hash everything a suite run depends on into a result cache key.
+
+    Covers the suite's source and fixture files, every conftest.py from the project root
+    down to the suite, pyproject.toml (pytest options), the tofusoup sources the suites
+    exercise, the harness binaries, the interpreter and installed package versions. Files are
+    fingerprinted by path, size and mtime rather than content, so computing the key costs
+    one stat per file.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((suite_name, pytest_args, sorted((k, str(v)) for k, v in env_vars.items()))).encode())
+    digest.update(_environment_fingerprint().encode())
+    suite_files = sorted(
+        p
+        for p in (project_root / suite_path_relative).rglob("*")
+        if p.suffix in _SUITE_CACHE_SUFFIXES and "__pycache__" not in p.parts and p.is_file()
+    )
+    # Shared fixtures and collection hooks above the suite directory, plus the pytest config
+    suite_parents = pathlib.Path(suite_path_relative).parents
+    config_files = [project_root / "pyproject.toml"] + [
+        project_root / parent / "conftest.py" for parent in reversed(suite_parents)
+    ]
+    source_files = sorted(_TOFUSOUP_SOURCE_ROOT.rglob("*.py"))
+    for path in (*config_files, *suite_files, *source_files, *harness_paths):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            digest.update(f"{path}:missing\n".encode())
+            continue
+        digest.update(f"{path}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def _suite_cache_path(project_root: pathlib.Path, cache_key: str) -> pathlib.Path:
+    return project_root / "soup" / "output" / "test-reports" / ".cache" / f"{cache_key}.json"
+
+
+def _load_cached_result(cache_path: pathlib.Path) -> TestSuiteResult | None:
+    """Return the cached suite result at cache_path, or None on a miss or unreadable entry."""
+    try:
+        return TestSuiteResult(**fast_json_loads(cache_path.read_bytes()))
+    except FileNotFoundError:
+        return None
+    except (ValueError, TypeError) as e:
+        logger.debug(f"Ignoring unreadable suite cache entry {cache_path}: {e}")
+        return None
+
+
+def _store_cached_result(cache_path: pathlib.Path, result: TestSuiteResult) -> None:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_text(json.dumps(attrs.asdict(result)), encoding="utf-8")
+
+
 TEST_SUITE_CONFIG = {
     "cty": {
         "path": "conformance/cty",
@@ -54,6 +246,53 @@ TEST_SUITE_CONFIG = {
     },
 }
 
+# Corrected invocation: Use `-o` to override configuration for this specific run.
+# This is the correct way to tell this pytest session to only find `souptest_` files.
+_PYTEST_BASE_CMD = (
+    sys.executable,
+    "-m",
+    "pytest",
+    "--json-report",
+    # Only summary, exitcode, duration, errors and failed test entries are read back
+    "--json-report-omit=collectors,keywords,log,streams,warnings",
+    "-o",
+    "python_files=souptest_*.py",
+)
+
+# Suites run concurrently, each as its own pytest process, and split the cores between them
+# with xdist workers when available; -n is left out when a suite would only get one worker
+_CPU_COUNT = os.cpu_count() or 1
+MAX_CONCURRENT_SUITES = min(len(TEST_SUITE_CONFIG), _CPU_COUNT)
+_XDIST_WORKERS = max(1, _CPU_COUNT // MAX_CONCURRENT_SUITES)
+_XDIST_ARGS = ("-n", str(_XDIST_WORKERS), "--dist", "loadfile") if HAS_XDIST and _XDIST_WORKERS > 1 else ()
+
+
+# Harness builds by (harness, project root), shared by suites so each harness is checked once
+_harness_builds: dict[tuple[str, pathlib.Path], asyncio.Future[pathlib.Path]] = {}
+
+
+async def _ensure_harness(
+    harness_key: str, project_root: pathlib.Path, loaded_config: dict[str, Any]
+) -> pathlib.Path:
+    """Run ensure_go_harness_build off the event loop, once per harness across all suites.
+
+    Suites that need a harness while its build is in flight await the same future; a
+    failed build is forgotten so the next suite retries it.
+    """
+    key = (harness_key, project_root)
+    build = _harness_builds.get(key)
+    if build is None:
+        build = asyncio.get_running_loop().run_in_executor(
+            None, ensure_go_harness_build, harness_key, project_root, loaded_config
+        )
+        _harness_builds[key] = build
+    try:
+        return await build
+    except Exception:
+        if _harness_builds.get(key) is build:
+            del _harness_builds[key]
+        raise
+
 
 async def _run_pytest_suite(
     suite_name: str,
@@ -71,24 +310,19 @@ async def _run_pytest_suite(
     reports_dir.mkdir(parents=True, exist_ok=True)
 
     # Create unique report file name to support parallel test execution
-    report_path = reports_dir / f"{suite_name}-report-{os.getpid()}.json"
+    report_path = reports_dir / f"{suite_name}{_REPORT_SUFFIX}"
 
-    # Corrected invocation: Use `-o` to override configuration for this specific run.
-    # This is the correct way to tell this pytest session to only find `souptest_` files.
+    # An explicit worker count in pytest_args wins over the default xdist split
+    xdist_args = () if any(arg.startswith(("-n", "--numprocesses")) for arg in pytest_args) else _XDIST_ARGS
     command = [
-        sys.executable,
-        "-m",
-        "pytest",
-        "--json-report",
+        *_PYTEST_BASE_CMD,
         f"--json-report-file={report_path}",
-        "-o",
-        "python_files=souptest_*.py",
         *pytest_args,
+        *xdist_args,
         str(pytest_target_path),
     ]
 
-    current_env = os.environ.copy()
-    current_env.update({k: str(v) for k, v in env_vars.items()})
+    current_env = os.environ | {k: str(v) for k, v in env_vars.items()}
 
     if logger.is_debug_enabled():
         logger.debug(f"Running pytest with command: {' '.join(command)}", env=current_env)
@@ -111,19 +345,8 @@ async def _run_pytest_suite(
         )
 
     def _process_test_report() -> TestSuiteResult:
-        try:
-            with report_path.open() as f:
-                report_content = f.read()
-                if not report_content:
-                    raise ValidationError("Empty test report file")
-                report = json.loads(report_content)
-        except FileNotFoundError as e:
-            raise ResourceError(f"Test report file not found: {report_path}") from e
-        except json.JSONDecodeError as e:
-            raise ValidationError(f"Invalid JSON in test report: {e}") from e
-
+        report = _load_test_report(report_path)
         summary = report.get("summary", {})
-        failures = [test for test in report.get("tests", []) if test.get("outcome") in ("failed", "error")]
         return TestSuiteResult(
             suite_name=suite_name,
             success=(report.get("exitcode", 1) == 0),
@@ -132,23 +355,26 @@ async def _run_pytest_suite(
             failed=summary.get("failed", 0),
             skipped=summary.get("skipped", 0),
             errors=len(report.get("errors", [])),
-            failures=failures,
+            failures=report["tests"],
         )
 
-    try:
-        with error_boundary(
-            Exception,
-            fallback=_get_fallback_result(),
-            log_errors=True,
-            reraise=False,
-        ):
-            return _process_test_report()
-        # If error_boundary caught an exception, return fallback
-        return _get_fallback_result()
-    finally:
-        # Keep report files for debugging - they're in a well-organized location
-        # and will be cleaned up by project cleanup scripts if needed
+    result = None
+    with error_boundary(
+        Exception,
+        fallback=_get_fallback_result(),
+        log_errors=True,
+        reraise=False,
+    ):
+        result = _process_test_report()
+    if result is None:
+        # error_boundary caught an exception; the raw report is kept as-is for debugging
         logger.debug(f"Test report saved to {report_path}")
+        return _get_fallback_result()
+
+    # Keep report files for debugging - they're in a well-organized location
+    # and will be cleaned up by project cleanup scripts if needed
+    logger.debug(f"Test report saved to {_compress_report(report_path)}")
+    return result
 
 
 async def run_test_suite(
@@ -162,9 +388,11 @@ async def run_test_suite(
         raise TofuSoupError(f"Test suite '{suite_name}' is not defined.")
 
     suite_cfg = TEST_SUITE_CONFIG[suite_name]
-    for harness_key in suite_cfg.get("required_harnesses", []):
-        if harness_key.startswith("go-") or harness_key == "soup-go":
-            ensure_go_harness_build(harness_key, project_root, loaded_config)
+    harness_paths = [
+        await _ensure_harness(harness_key, project_root, loaded_config)
+        for harness_key in suite_cfg.get("required_harnesses", [])
+        if harness_key.startswith("go-") or harness_key == "soup-go"
+    ]
 
     suite_defaults = loaded_config.get("test_suite_defaults", {})
     suite_specific = loaded_config.get("test_suite", {}).get(suite_name, {})
@@ -179,14 +407,42 @@ async def run_test_suite(
         pytest_args.extend(pytest_options)
 
     suite_path = cast(str, suite_cfg["path"])
-    return await _run_pytest_suite(suite_name, project_root, suite_path, pytest_args, env_vars)
+    if os.environ.get(ENV_SOUP_NO_CACHE) == "1":
+        return await _run_pytest_suite(suite_name, project_root, suite_path, pytest_args, env_vars)
+
+    # Skip the pytest run entirely when nothing the suite depends on has changed
+    cache_key = _suite_cache_key(
+        suite_name,
+        project_root=project_root,
+        suite_path_relative=suite_path,
+        pytest_args=pytest_args,
+        env_vars=env_vars,
+        harness_paths=harness_paths,
+    )
+    cache_path = _suite_cache_path(project_root, cache_key)
+    cached = _load_cached_result(cache_path)
+    if cached is not None:
+        logger.info(f"Using cached result for test suite '{suite_name}' ({cache_key})")
+        return cached
+
+    result = await _run_pytest_suite(suite_name, project_root, suite_path, pytest_args, env_vars)
+    # Only passing runs are cached so failures (including runner errors) are always re-run
+    if result.success:
+        _store_cached_result(cache_path, result)
+    return result
 
 
 async def run_all_test_suites(
     project_root: pathlib.Path, loaded_config: dict[str, Any], verbose: bool
 ) -> list[TestSuiteResult]:
-    tasks = [run_test_suite(name, project_root, loaded_config, verbose, None) for name in TEST_SUITE_CONFIG]
-    return await asyncio.gather(*tasks)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SUITES)
+
+    async def _run_bounded(suite_name: str) -> TestSuiteResult:
+        async with semaphore:
+            return await run_test_suite(suite_name, project_root, loaded_config, verbose, None)
+
+    # gather (rather than a TaskGroup) so a TofuSoupError reaches the CLI unwrapped
+    return await asyncio.gather(*(_run_bounded(name) for name in TEST_SUITE_CONFIG))
 
 
 # 🥣🔬🔚
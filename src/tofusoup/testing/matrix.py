@@ -11,19 +11,22 @@ providers against multiple versions of Terraform/OpenTofu.
 Note: Matrix testing requires the optional 'wrknv' dependency."""
 
 import asyncio
-from collections.abc import Callable
-from dataclasses import dataclass, field
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator
 import itertools
-import json
+import math
 import os
 import pathlib
+from time import monotonic
 from typing import Any
 
+from attrs import asdict, define, field
 from rich.console import Console
-from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
-from rich.table import Table
 
-from tofusoup.config.defaults import MATRIX_PARALLEL_JOBS, MATRIX_TIMEOUT_MINUTES
+from tofusoup.common.exceptions import TofuSoupError
+from tofusoup.common.serialization import fast_json_dumps, fast_json_loads
+from tofusoup.common.utils import decode_output
+from tofusoup.config.defaults import ENV_TOFUSOUP_MATRIX_PARALLEL, MATRIX_PARALLEL_JOBS, MATRIX_TIMEOUT_MINUTES
 
 # Optional wrknv imports
 try:
@@ -38,12 +41,42 @@ except ImportError:
 
 console = Console()
 
+# Status cell markup for the results table
+_PASS_MARKUP = "[green]✅ PASS[/green]"
+_FAIL_MARKUP = "[red]❌ FAIL[/red]"
 
-@dataclass
+# Relative install cost per tool, used to order combinations so heavier installs repeat less
+_TOOL_INSTALL_COST = {"terraform": 2, "tofu": 1}
+
+# Passing combinations are pushed to the progress bar in batches of this size, or this often (s)
+_PROGRESS_BATCH = 8
+_PROGRESS_INTERVAL = 0.25
+
+
+def resolve_parallel_jobs(configured: Any) -> int:
+    """Resolve matrix parallelism: matrix.parallel_jobs, else TOFUSOUP_MATRIX_PARALLEL, else MATRIX_PARALLEL_JOBS.
+
+    An explicit setting (including 0) takes precedence over the environment; the result is
+    clamped to at least 1.
+    """
+    if configured is not None:
+        source, value = "matrix.parallel_jobs", configured
+    elif (env_value := os.environ.get(ENV_TOFUSOUP_MATRIX_PARALLEL)) is not None:
+        source, value = ENV_TOFUSOUP_MATRIX_PARALLEL, env_value
+    else:
+        return MATRIX_PARALLEL_JOBS
+    try:
+        return max(1, int(value))
+    except (TypeError, ValueError) as e:
+        raise TofuSoupError(f"Invalid {source} value {value!r}: expected an integer") from e
+
+
+# Frozen for immutability, but not hashable: the dict fields can't take part in a hash
+@define(frozen=True, unsafe_hash=False)
 class MatrixCombination:
     """Represents a specific combination of tool versions."""
 
-    tools: dict[str, str] = field(default_factory=dict)
+    tools: dict[str, str] = field(factory=dict)
 
     def __str__(self) -> str:
         """String representation for display."""
@@ -52,7 +85,7 @@ class MatrixCombination:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
-        return {"tools": self.tools}
+        return asdict(self)
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "MatrixCombination":
@@ -60,7 +93,7 @@ class MatrixCombination:
         return cls(tools=data.get("tools", {}))
 
 
-@dataclass
+@define(frozen=True, unsafe_hash=False)
 class MatrixResult:
     """Result from testing a matrix combination."""
 
@@ -68,17 +101,11 @@ class MatrixResult:
     success: bool
     duration_seconds: float = 0.0
     error_message: str | None = None
-    test_results: dict[str, Any] = field(default_factory=dict)
+    test_results: dict[str, Any] = field(factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
-        return {
-            "combination": self.combination.to_dict(),
-            "success": self.success,
-            "duration_seconds": self.duration_seconds,
-            "error_message": self.error_message,
-            "test_results": self.test_results,
-        }
+        return asdict(self)
 
 
 class VersionMatrix:
@@ -107,16 +134,27 @@ class VersionMatrix:
 
         # Get matrix configuration (from soup.toml or wrkenv.toml)
         self.matrix_config = self.config.get_setting("matrix", {})
-        self.parallel_jobs = self.matrix_config.get("parallel_jobs", MATRIX_PARALLEL_JOBS)
+        self.parallel_jobs = resolve_parallel_jobs(self.matrix_config.get("parallel_jobs"))
         self.timeout_minutes = self.matrix_config.get("timeout_minutes", MATRIX_TIMEOUT_MINUTES)
 
-    def generate_combinations(self) -> list[MatrixCombination]:
-        """
-        Generate all combinations for matrix testing.
+        # Environment snapshot every combination's stir run starts from
+        self._base_env = os.environ.copy()
 
-        Returns:
-            List of MatrixCombination objects to test
-        """
+        # Tool managers by tool name, shared by every combination
+        self._manager_cache: dict[str, Any] = {}
+        # One lock per (tool, version) so concurrent combinations never install the same version twice
+        self._install_locks: defaultdict[tuple[str, str], asyncio.Lock] = defaultdict(asyncio.Lock)
+        # (tool, version) pairs known to be installed; _run_stir_test selects binaries by version via PATH
+        self._installed: set[tuple[str, str]] = set()
+
+    def _manager(self, tool_name: str) -> Any:
+        """Return the (memoized) wrknv tool manager for a tool, or None if there is none."""
+        if tool_name not in self._manager_cache:
+            self._manager_cache[tool_name] = get_tool_manager(tool_name, self.config)
+        return self._manager_cache[tool_name]
+
+    def _tool_versions(self) -> dict[str, list[str]]:
+        """Build the list of versions to test for each tool, base version first."""
         # Get version lists from matrix config
         matrix_versions = self.matrix_config.get("versions", {})
 
@@ -136,20 +174,34 @@ class VersionMatrix:
 
             tool_versions[tool_name] = all_versions
 
-        # Generate all combinations
-        combinations: list[MatrixCombination] = []
+        return tool_versions
+
+    def count_combinations(self) -> int:
+        """Return the number of combinations generate_combinations() yields, without building them."""
+        tool_versions = self._tool_versions()
+        return math.prod(len(versions) for versions in tool_versions.values()) if tool_versions else 0
 
+    def generate_combinations(self) -> Iterator[MatrixCombination]:
+        """
+        Generate all combinations for matrix testing.
+
+        Combinations are yielded lazily, so callers never hold the full Cartesian product.
+
+        Yields:
+            MatrixCombination objects to test
+        """
+        tool_versions = self._tool_versions()
         if not tool_versions:
-            return combinations
+            return
 
-        tool_names = list(tool_versions.keys())
+        # itertools.product varies the last list fastest, so the costliest install goes first and
+        # changes least often; each combination's tools keep the base_tools order for display
+        tool_names = sorted(tool_versions, key=lambda tool: -_TOOL_INSTALL_COST.get(tool, 0))
         version_lists = [tool_versions[tool] for tool in tool_names]
 
         for version_combo in itertools.product(*version_lists):
-            combo_dict = dict(zip(tool_names, version_combo, strict=False))
-            combinations.append(MatrixCombination(tools=combo_dict))
-
-        return combinations
+            versions = dict(zip(tool_names, version_combo, strict=False))
+            yield MatrixCombination(tools={tool: versions[tool] for tool in tool_versions})
 
     async def run_stir_tests(
         self, stir_directory: pathlib.Path, test_filter: Callable[[MatrixCombination], bool] | None = None
@@ -164,12 +216,16 @@ class VersionMatrix:
         Returns:
             Dictionary containing test results and statistics
         """
-        combinations = self.generate_combinations()
+        combinations: Iterable[MatrixCombination] = self.generate_combinations()
 
         if test_filter:
+            # A filter's selectivity is unknown up front, so filtered runs are counted by materializing
             combinations = [c for c in combinations if test_filter(c)]
+            total = len(combinations)
+        else:
+            total = self.count_combinations()
 
-        if not combinations:
+        if not total:
             return {
                 "success_count": 0,
                 "failure_count": 0,
@@ -177,14 +233,14 @@ class VersionMatrix:
                 "message": "No combinations to test",
             }
 
-        console.print(f"\n[bold cyan]Running {len(combinations)} matrix combinations...[/bold cyan]")
+        console.print(f"\n[bold cyan]Running {total} matrix combinations...[/bold cyan]")
 
-        results = []
-        semaphore = asyncio.Semaphore(self.parallel_jobs)
+        results: list[MatrixResult] = []
+        # Shared by all workers, so each combination is pulled (and built) only when a worker is free
+        pending = iter(combinations)
 
-        async def test_combination(combo: MatrixCombination) -> MatrixResult:
-            async with semaphore:
-                return await self._test_single_combination(combo, stir_directory)
+        # rich.progress is only needed once a run starts, so keep it off the import path
+        from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
 
         # Run all combinations with progress tracking
         with Progress(
@@ -194,22 +250,34 @@ class VersionMatrix:
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
             TimeElapsedColumn(),
             console=console,
+            refresh_per_second=4,
+            transient=True,
         ) as progress:
-            task = progress.add_task("Testing combinations...", total=len(combinations))
-
-            tasks = [test_combination(combo) for combo in combinations]
-
-            for coro in asyncio.as_completed(tasks):
-                result = await coro
-                results.append(result)
-                progress.advance(task)
-
-                # Update progress description with latest result
-                status = "✅" if result.success else "❌"
-                progress.update(
-                    task,
-                    description=f"Testing combinations... {status} {result.combination}",
-                )
+            task = progress.add_task("Testing combinations...", total=total)
+
+            # Completions not yet pushed to the progress bar, and when it was last updated
+            unreported = 0
+            last_update = monotonic()
+
+            def report(description: str | None = None) -> None:
+                nonlocal unreported, last_update
+                unreported += 1
+                now = monotonic()
+                # Failures update immediately; passes are batched
+                if description or unreported >= _PROGRESS_BATCH or now - last_update >= _PROGRESS_INTERVAL:
+                    progress.update(task, advance=unreported, description=description)
+                    unreported = 0
+                    last_update = now
+
+            async def worker() -> None:
+                for combo in pending:
+                    result = await self._test_single_combination(combo, stir_directory)
+                    results.append(result)
+                    # Only failures are worth formatting into the description
+                    report(None if result.success else f"Testing combinations... ❌ {result.combination}")
+
+            await asyncio.gather(*(worker() for _ in range(min(self.parallel_jobs, total))))
+            progress.update(task, advance=unreported)
 
         # Show results summary
         self._display_results_table(results)
@@ -222,7 +290,7 @@ class VersionMatrix:
             "success_count": success_count,
             "failure_count": failure_count,
             "results": [r.to_dict() for r in results],
-            "total_combinations": len(combinations),
+            "total_combinations": total,
             "parallel_jobs": self.parallel_jobs,
         }
 
@@ -230,9 +298,7 @@ class VersionMatrix:
         self, combination: MatrixCombination, stir_directory: pathlib.Path
     ) -> MatrixResult:
         """Test a single tool version combination."""
-        import time
-
-        start_time = time.time()
+        start_time = monotonic()
 
         try:
             # Install all tools in this combination
@@ -241,7 +307,7 @@ class VersionMatrix:
             # Run soup stir with this combination
             result = await self._run_stir_test(combination, stir_directory)
 
-            duration = time.time() - start_time
+            duration = monotonic() - start_time
 
             return MatrixResult(
                 combination=combination,
@@ -251,7 +317,7 @@ class VersionMatrix:
             )
 
         except Exception as e:
-            duration = time.time() - start_time
+            duration = monotonic() - start_time
 
             return MatrixResult(
                 combination=combination,
@@ -261,34 +327,51 @@ class VersionMatrix:
             )
 
     async def _install_combination_tools(self, combination: MatrixCombination) -> None:
-        """Install all tools for a specific combination."""
+        """Install all tools for a specific combination, downloading them concurrently."""
+        to_install = []
         for tool_name, version in combination.tools.items():
-            manager = get_tool_manager(tool_name, self.config)
+            if (tool_name, version) in self._installed:
+                continue
+            manager = self._manager(tool_name)
             if not manager:
                 raise Exception(f"No manager available for tool: {tool_name}")
+            to_install.append((tool_name, version, manager))
+
+        await asyncio.gather(*(self._install_tool(*item) for item in to_install))
+
+    async def _install_tool(self, tool_name: str, version: str, manager: Any) -> None:
+        """Install one tool version unless it is already installed.
+
+        Concurrent combinations needing the same (tool, version) wait on a shared lock, so
+        only the first one downloads it and the rest find it installed.
+        """
+        key = (tool_name, version)
+        async with self._install_locks[key]:
+            if key in self._installed:
+                return  # Installed by a concurrent combination while we waited
 
             # Check if already installed
             current_version = manager.get_installed_version()
             if current_version == version:
                 binary_path = manager.get_current_binary_path()
                 if binary_path and binary_path.exists():
-                    continue  # Already installed
+                    self._installed.add(key)
+                    return  # Already installed
 
             # Install the specific version
             console.print(f"Installing {tool_name} {version} for matrix testing...")
-            await asyncio.get_event_loop().run_in_executor(
+            await asyncio.get_running_loop().run_in_executor(
                 None,
                 manager.install_version,
                 version,
                 False,  # not dry_run
             )
+            self._installed.add(key)
 
     async def _run_stir_test(
         self, combination: MatrixCombination, stir_directory: pathlib.Path
     ) -> dict[str, Any]:
         """Run soup stir test for a specific combination."""
-        import json
-
         # Build the soup stir command
         cmd = [
             "soup",
@@ -297,16 +380,16 @@ class VersionMatrix:
             "--json",  # Get JSON output for parsing
         ]
 
-        # Set up environment with the tool versions
-        env = dict(os.environ)
+        # Set up environment with the tool versions; later tools end up first on PATH
+        tool_dirs: list[str] = []
         for tool_name, version in combination.tools.items():
             # Ensure the right version is active
-            manager = get_tool_manager(tool_name, self.config)
+            manager = self._manager(tool_name)
             if manager:
                 binary_path = manager.get_binary_path(version)
                 if binary_path.exists():
-                    # Add to PATH
-                    env["PATH"] = f"{binary_path.parent}:{env.get('PATH', '')}"
+                    tool_dirs.insert(0, str(binary_path.parent))
+        env = self._base_env | {"PATH": ":".join([*tool_dirs, self._base_env.get("PATH", "")])}
 
         # Run the stir command
         process = await asyncio.create_subprocess_exec(
@@ -320,21 +403,29 @@ class VersionMatrix:
 
         result: dict[str, Any]
         if process.returncode == 0:
-            # Parse JSON output if available
-            try:
-                result = json.loads(stdout.decode())
+            # Parse JSON output if available; stir renders a rich report instead of a JSON document
+            # outside matrix mode, so anything not shaped like an object skips the parser
+            parsed = None
+            if stdout.lstrip().startswith(b"{"):
+                try:
+                    # stdout bytes go straight to the parser (orjson when installed)
+                    parsed = fast_json_loads(stdout)
+                except ValueError:
+                    parsed = None
+            if isinstance(parsed, dict):
+                result = parsed
                 result["success"] = True
-            except (json.JSONDecodeError, ValueError):
+            else:
                 result = {
                     "success": True,
-                    "stdout": stdout.decode(),
-                    "stderr": stderr.decode(),
+                    "stdout": decode_output(stdout),
+                    "stderr": decode_output(stderr),
                 }
         else:
             result = {
                 "success": False,
-                "stdout": stdout.decode(),
-                "stderr": stderr.decode(),
+                "stdout": decode_output(stdout),
+                "stderr": decode_output(stderr),
                 "returncode": process.returncode,
             }
 
@@ -342,6 +433,8 @@ class VersionMatrix:
 
     def _display_results_table(self, results: list[MatrixResult]) -> None:
         """Display results in a nice table."""
+        from rich.table import Table
+
         table = Table(title="Matrix Test Results")
 
         # Add columns
@@ -354,7 +447,7 @@ class VersionMatrix:
         for result in results:
             duration = f"{result.duration_seconds:.1f}s"
             error = result.error_message or ""
-            status = "[green]✅ PASS[/green]" if result.success else "[red]❌ FAIL[/red]"
+            status = _PASS_MARKUP if result.success else _FAIL_MARKUP
 
             table.add_row(
                 str(result.combination),
@@ -367,8 +460,7 @@ class VersionMatrix:
 
     def save_results(self, results: dict[str, Any], output_path: pathlib.Path) -> None:
         """Save matrix test results to a file."""
-        with output_path.open("w") as f:
-            json.dump(results, f, indent=2)
+        output_path.write_bytes(fast_json_dumps(results, indent=True))
 
         console.print(f"[green]Matrix test results saved to: {output_path}[/green]")
 
@@ -11,15 +11,21 @@ to test against specific tool configurations.
 Note: Matrix testing requires the optional 'wrknv' dependency."""
 
 import asyncio
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+import os
 from pathlib import Path
+from time import monotonic
 from typing import Any
 
 from rich.console import Console
-from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
-from rich.table import Table
 
-from tofusoup.config.defaults import MATRIX_PARALLEL_JOBS, MATRIX_TIMEOUT_MINUTES
+from tofusoup.common.exceptions import TofuSoupError
+from tofusoup.common.serialization import fast_json_dumps, fast_json_loads
+from tofusoup.common.utils import decode_output
+from tofusoup.config.defaults import MATRIX_MAX_OUTPUT_BYTES, MATRIX_TIMEOUT_MINUTES
+from tofusoup.testing.matrix import resolve_parallel_jobs
 
 # Optional wrknv imports - graceful degradation if not available
 try:
@@ -34,6 +40,29 @@ except ImportError:
 
 console = Console()
 
+# Status cell markup for the results table
+_PASS_MARKUP = "[green]✅ PASS[/green]"
+_FAIL_MARKUP = "[red]❌ FAIL[/red]"
+
+# Chunk size for draining stir subprocess output
+_PIPE_READ_SIZE = 1 << 16
+
+
+async def _drain(stream: asyncio.StreamReader | None, limit: int) -> bytearray:
+    """Read a subprocess pipe to EOF in chunks, appending into one buffer of at most `limit` bytes."""
+    buffer = bytearray()
+    if stream is not None:
+        while chunk := await stream.read(_PIPE_READ_SIZE):
+            buffer += chunk
+            if len(buffer) > limit:
+                raise TofuSoupError(f"soup stir output exceeded {limit} bytes")
+    return buffer
+
+
+def _is_installed(manager: Any, version: str) -> bool:
+    """Return True if the binary for `version` has already been downloaded."""
+    return bool(manager.get_binary_path(version).exists())
+
 
 @dataclass
 class ProfileTestResult:
@@ -58,6 +87,13 @@ class ProfileTestResult:
         }
 
 
+def _json_default(obj: Any) -> Any:
+    """Serialize ProfileTestResult objects on demand while writing results."""
+    if isinstance(obj, ProfileTestResult):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 class ProfileMatrix:
     """Manages profile-based matrix testing for TofuSoup."""
 
@@ -73,8 +109,26 @@ class ProfileMatrix:
         # Get matrix configuration
         self.matrix_config = self.config.get_setting("matrix", {})
         self.matrix_profiles = self.matrix_config.get("profiles", [])
-        self.parallel_jobs = self.matrix_config.get("parallel_jobs", MATRIX_PARALLEL_JOBS)
+        self.parallel_jobs = resolve_parallel_jobs(self.matrix_config.get("parallel_jobs"))
         self.timeout_minutes = self.matrix_config.get("timeout_minutes", MATRIX_TIMEOUT_MINUTES)
+        self.max_output_bytes = self.matrix_config.get("max_stir_output_bytes", MATRIX_MAX_OUTPUT_BYTES)
+        # Flavor for profiles that don't set terraform_flavor themselves
+        self._default_flavor = self.config.get_setting("terraform_flavor", "terraform")
+        # Environment snapshot that each profile run overlays its WORKENV_PROFILE onto
+        self._base_env = os.environ.copy()
+
+        # Tool installs run here; each concurrent profile run installs at most one tool at a time.
+        # Threads are only started on first use.
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, self.parallel_jobs), thread_name_prefix="soup-install"
+        )
+        # One lock per (tool, version), and the pairs known to be installed during this run
+        self._install_locks: defaultdict[tuple[str, str], asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._installed: set[tuple[str, str]] = set()
+
+    async def aclose(self) -> None:
+        """Shut down the tool install executor, waiting for running installs off the event loop."""
+        await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown)
 
     def get_test_profiles(self) -> list[str]:
         """
@@ -102,7 +156,7 @@ class ProfileMatrix:
             profiles: Optional list of specific profiles to test
 
         Returns:
-            Dictionary containing test results and statistics
+            Dictionary containing test results (ProfileTestResult objects) and statistics
         """
         test_profiles = profiles or self.get_test_profiles()
 
@@ -116,12 +170,12 @@ class ProfileMatrix:
 
         console.print(f"\n[bold cyan]Running tests for {len(test_profiles)} profiles...[/bold cyan]")
 
-        results = []
-        semaphore = asyncio.Semaphore(self.parallel_jobs)
+        results: list[ProfileTestResult] = []
+        # Shared by all workers, so only parallel_jobs profile runs are ever in flight
+        pending = iter(test_profiles)
 
-        async def test_profile(profile_name: str) -> ProfileTestResult:
-            async with semaphore:
-                return await self._test_single_profile(profile_name, stir_directory)
+        # rich.progress is only needed once a run starts, so keep it off the import path
+        from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
 
         # Run all profiles with progress tracking
         with Progress(
@@ -131,22 +185,29 @@ class ProfileMatrix:
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
             TimeElapsedColumn(),
             console=console,
+            refresh_per_second=4,
+            transient=True,
         ) as progress:
             task = progress.add_task("Testing profiles...", total=len(test_profiles))
 
-            tasks = [test_profile(profile) for profile in test_profiles]
-
-            for coro in asyncio.as_completed(tasks):
-                result = await coro
-                results.append(result)
-                progress.advance(task)
-
-                # Update progress description with latest result
-                status = "✅" if result.success else "❌"
-                progress.update(
-                    task,
-                    description=f"Testing profiles... {status} {result.profile_name}",
-                )
+            async def worker() -> None:
+                for profile_name in pending:
+                    result = await self._test_single_profile(profile_name, stir_directory)
+                    results.append(result)
+                    if result.success:
+                        progress.advance(task)
+                    else:
+                        # Only failures are worth formatting into the description
+                        progress.update(
+                            task,
+                            advance=1,
+                            description=f"Testing profiles... ❌ {result.profile_name}",
+                        )
+
+            # A TaskGroup cancels the remaining workers if one fails unexpectedly
+            async with asyncio.TaskGroup() as tg:
+                for _ in range(min(self.parallel_jobs, len(test_profiles))):
+                    tg.create_task(worker())
 
         # Show results summary
         self._display_results_table(results)
@@ -158,17 +219,14 @@ class ProfileMatrix:
         return {
             "success_count": success_count,
             "failure_count": failure_count,
-            "results": [r.to_dict() for r in results],
+            "results": results,
             "total_profiles": len(test_profiles),
             "parallel_jobs": self.parallel_jobs,
         }
 
     async def _test_single_profile(self, profile_name: str, stir_directory: Path) -> ProfileTestResult:
         """Test a single profile configuration."""
-        import os
-        import time
-
-        start_time = time.time()
+        start_time = monotonic()
 
         try:
             # Get profile configuration
@@ -177,28 +235,18 @@ class ProfileMatrix:
                 raise Exception(f"Profile '{profile_name}' not found")
 
             # Extract tools from profile
-            tools = {}
-            terraform_flavor = profile.get(
-                "terraform_flavor", self.config.get_setting("terraform_flavor", "terraform")
-            )
-
-            # Get the appropriate tool based on flavor
-            if terraform_flavor == "opentofu" and "tofu" in profile:
-                tools["tofu"] = profile["tofu"]
-            elif "terraform" in profile:
-                tools["terraform"] = profile["terraform"]
+            tools = self._resolve_profile_tools(profile)
 
             # Install tools for this profile
-            await self._install_profile_tools(profile_name, profile)
+            managers = await self._install_profile_tools(profile_name, tools)
 
-            # Set up environment for this profile
-            env = dict(os.environ)
-            env["WORKENV_PROFILE"] = profile_name
+            # Set up environment for this profile, pinning its tool binaries first on PATH
+            env = self._profile_env(profile_name, tools, managers)
 
             # Run soup stir with this profile
             result = await self._run_stir_test(profile_name, stir_directory, env)
 
-            duration = time.time() - start_time
+            duration = monotonic() - start_time
 
             return ProfileTestResult(
                 profile_name=profile_name,
@@ -209,7 +257,7 @@ class ProfileMatrix:
             )
 
         except Exception as e:
-            duration = time.time() - start_time
+            duration = monotonic() - start_time
 
             return ProfileTestResult(
                 profile_name=profile_name,
@@ -218,47 +266,82 @@ class ProfileMatrix:
                 error_message=str(e),
             )
 
-    async def _install_profile_tools(self, profile_name: str, profile: dict[str, Any]) -> None:
-        """Install all tools for a specific profile."""
-        # Determine which tools to install based on terraform_flavor
-        terraform_flavor = profile.get(
-            "terraform_flavor", self.config.get_setting("terraform_flavor", "terraform")
-        )
+    def _resolve_profile_tools(self, profile: dict[str, Any]) -> dict[str, str]:
+        """Pick the tools (and versions) a profile runs with, based on its terraform_flavor."""
+        terraform_flavor = profile.get("terraform_flavor", self._default_flavor)
 
-        tools_to_install = {}
+        # Get the appropriate tool based on flavor
         if terraform_flavor == "opentofu" and "tofu" in profile:
-            tools_to_install["tofu"] = profile["tofu"]
-        elif "terraform" in profile:
-            tools_to_install["terraform"] = profile["terraform"]
+            return {"tofu": profile["tofu"]}
+        if "terraform" in profile:
+            return {"terraform": profile["terraform"]}
+        return {}
 
-        # Install each tool
-        for tool_name, version in tools_to_install.items():
+    async def _install_profile_tools(
+        self, profile_name: str, tools_to_install: dict[str, str]
+    ) -> dict[str, Any]:
+        """Install all tools resolved for a specific profile and return their managers by tool name."""
+        # Resolve every manager first, then install the tools concurrently
+        managers = {}
+        for tool_name in tools_to_install:
             manager = get_tool_manager(tool_name, self.config)
             if not manager:
                 raise Exception(f"No manager available for tool: {tool_name}")
+            managers[tool_name] = manager
 
-            # Check if already installed
-            current_version = manager.get_installed_version()
-            if current_version == version:
-                binary_path = manager.get_current_binary_path()
-                if binary_path and binary_path.exists():
-                    continue  # Already installed
-
-            # Install the specific version
-            console.print(f"Installing {tool_name} {version} for profile '{profile_name}'...")
-            await asyncio.get_event_loop().run_in_executor(
-                None,
-                manager.install_version,
-                version,
-                False,  # not dry_run
+        await asyncio.gather(
+            *(
+                self._install_tool(profile_name, tool_name, version, managers[tool_name])
+                for tool_name, version in tools_to_install.items()
             )
+        )
+        return managers
+
+    def _profile_env(
+        self, profile_name: str, tools: dict[str, str], managers: dict[str, Any]
+    ) -> dict[str, str]:
+        """Build a profile's stir environment with its tool versions first on PATH.
+
+        Profiles run concurrently and may need different versions of the same tool, so
+        each run selects its binaries through PATH rather than the tool's active version.
+        """
+        tool_dirs = [
+            str(managers[tool_name].get_binary_path(version).parent) for tool_name, version in tools.items()
+        ]
+        return self._base_env | {
+            "WORKENV_PROFILE": profile_name,
+            "PATH": os.pathsep.join([*tool_dirs, self._base_env.get("PATH", "")]),
+        }
+
+    async def _install_tool(self, profile_name: str, tool_name: str, version: str, manager: Any) -> None:
+        """Download one tool version for a profile unless it is already downloaded.
+
+        Profiles sharing a (tool, version) wait on one lock, so the download probe and any
+        download happen once per run. Only the download is memoized; each profile run
+        selects its version through PATH (see _profile_env), not the tool's active version.
+        """
+        key = (tool_name, version)
+        async with self._install_locks[key]:
+            if key in self._installed:
+                return
+
+            loop = asyncio.get_running_loop()
+            # The download probe stats the filesystem, so keep it off the event loop
+            if not await loop.run_in_executor(self._executor, _is_installed, manager, version):
+                # Install the specific version
+                console.print(f"Installing {tool_name} {version} for profile '{profile_name}'...")
+                await loop.run_in_executor(
+                    self._executor,
+                    manager.install_version,
+                    version,
+                    False,  # not dry_run
+                )
+            self._installed.add(key)
 
     async def _run_stir_test(
         self, profile_name: str, stir_directory: Path, env: dict[str, str]
     ) -> dict[str, Any]:
         """Run soup stir test for a specific profile."""
-        import json
-
         # Build the soup stir command
         cmd = [
             "soup",
@@ -275,25 +358,37 @@ class ProfileMatrix:
             stderr=asyncio.subprocess.PIPE,
         )
 
-        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=self.timeout_minutes * 60)
+        # Drain both pipes into growable buffers while waiting, instead of communicate()'s
+        # read-to-EOF plus final bytes copy; a run that times out or floods its output is killed
+        limit = self.max_output_bytes
+        try:
+            stdout, stderr, _ = await asyncio.wait_for(
+                asyncio.gather(_drain(process.stdout, limit), _drain(process.stderr, limit), process.wait()),
+                timeout=self.timeout_minutes * 60,
+            )
+        except (TimeoutError, TofuSoupError):
+            process.kill()
+            await process.wait()
+            raise
 
         result: dict[str, Any]
         if process.returncode == 0:
             # Parse JSON output if available
             try:
-                result = json.loads(stdout.decode())
+                # stdout bytes go straight to the parser (orjson when installed)
+                result = fast_json_loads(stdout)
                 result["success"] = True
-            except (json.JSONDecodeError, ValueError):
+            except ValueError:
                 result = {
                     "success": True,
-                    "stdout": stdout.decode(),
-                    "stderr": stderr.decode(),
+                    "stdout": decode_output(stdout),
+                    "stderr": decode_output(stderr),
                 }
         else:
             result = {
                 "success": False,
-                "stdout": stdout.decode(),
-                "stderr": stderr.decode(),
+                "stdout": decode_output(stdout),
+                "stderr": decode_output(stderr),
                 "returncode": process.returncode,
             }
 
@@ -301,6 +396,8 @@ class ProfileMatrix:
 
     def _display_results_table(self, results: list[ProfileTestResult]) -> None:
         """Display results in a nice table."""
+        from rich.table import Table
+
         table = Table(title="Profile Test Results")
 
         # Add columns
@@ -314,7 +411,7 @@ class ProfileMatrix:
         for result in results:
             duration = f"{result.duration_seconds:.1f}s"
             error = result.error_message or ""
-            status = "[green]✅ PASS[/green]" if result.success else "[red]❌ FAIL[/red]"
+            status = _PASS_MARKUP if result.success else _FAIL_MARKUP
 
             # Format tools display
             tools_str = ", ".join(f"{k}:{v}" for k, v in result.tools.items()) if result.tools else "N/A"
@@ -331,10 +428,7 @@ class ProfileMatrix:
 
     def save_results(self, results: dict[str, Any], output_path: Path) -> None:
         """Save profile test results to a file."""
-        import json
-
-        with output_path.open("w") as f:
-            json.dump(results, f, indent=2)
+        output_path.write_bytes(fast_json_dumps(results, indent=True, default=_json_default))
 
         console.print(f"[green]Profile test results saved to: {output_path}[/green]")
 
@@ -355,7 +449,10 @@ async def run_profile_matrix_tests(
         Test results dictionary
     """
     matrix = ProfileMatrix(config)
-    return await matrix.run_profile_tests(stir_directory, profiles)
+    try:
+        return await matrix.run_profile_tests(stir_directory, profiles)
+    finally:
+        await matrix.aclose()
 
 
 # 🥣🔬🔚
@@ -11,7 +11,7 @@ import click
 import msgpack  # type: ignore[import-untyped]
 from rich import print_json
 
-from .logic import convert_json_to_msgpack, convert_msgpack_to_json
+from .logic import convert_json_to_msgpack, unpack_msgpack_to_json
 
 
 @click.group()
@@ -61,11 +61,10 @@ def to_msgpack(input_path: Path, output_path: Path | None) -> None:
 def to_json(input_path: Path, output_path: Path | None, pretty: bool) -> None:
     """Converts a MessagePack wire format file to JSON."""
     try:
-        result_path = convert_msgpack_to_json(input_path, output_path)
+        _, data = unpack_msgpack_to_json(input_path, output_path)
         if pretty:
-            # Read back the result for pretty printing
-            json_data = result_path.read_text("utf-8")
-            print_json(json_data)
+            # Print the decoded data directly rather than reading the written file back
+            print_json(data=data)
     except msgpack.exceptions.UnpackException as e:
         raise click.ClickException(f"Error unpacking MessagePack file: {e}") from e
     except Exception as e:
@@ -10,14 +10,23 @@ from provide.foundation import TelemetryConfig, get_hub
 
 from tofusoup.common.config import TofuSoupConfig
 
+# Set once the foundation has been initialized, so repeat calls are free
+_CONFIGURED = False
 
-def configure_logging() -> None:
+
+def configure_logging(force: bool = False) -> None:
     """
     Configures Pyvider Telemetry for the library.
 
     This setup ensures that all log output is structured as JSON and directed
     to STDERR, preventing interference with the wire protocol's STDOUT/STDIN.
+    Only the first call does any work unless `force` is set (e.g. in tests that
+    change the environment between calls).
     """
+    global _CONFIGURED
+    if _CONFIGURED and not force:
+        return
+
     # Load TofuSoup configuration from environment
     tofusoup_config = TofuSoupConfig.from_env()
 
@@ -39,6 +48,7 @@ def configure_logging() -> None:
 
     hub = get_hub()
     hub.initialize_foundation(config=config)
+    _CONFIGURED = True
 
 
 # 🥣🔬🔚
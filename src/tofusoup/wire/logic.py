@@ -4,11 +4,13 @@
 #
 
 
-import json
 from pathlib import Path
+from typing import Any
 
 import msgpack  # type: ignore[import-untyped]
 
+from tofusoup.common.serialization import fast_json_dumps, fast_json_loads
+
 
 def convert_json_to_msgpack(input_path: Path, output_path: Path | None) -> Path:
     """
@@ -22,15 +24,17 @@ def convert_json_to_msgpack(input_path: Path, output_path: Path | None) -> Path:
     Returns:
         The path to the created MessagePack file.
     """
-    if not input_path.exists():
-        raise FileNotFoundError(f"Input file not found: {input_path}")
-
     if output_path is None:
         output_path = input_path.with_suffix(".msgpack")
 
-    data = json.loads(input_path.read_text("utf-8"))
-    packed_data = msgpack.packb(data)
-    output_path.write_bytes(packed_data)
+    try:
+        raw = input_path.read_bytes()
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Input file not found: {input_path}") from e
+    # Parsed straight from bytes; orjson when installed
+    data = fast_json_loads(raw)
+    with output_path.open("wb") as fout:
+        msgpack.pack(data, fout, use_bin_type=True)
     return output_path
 
 
@@ -46,15 +50,39 @@ def convert_msgpack_to_json(input_path: Path, output_path: Path | None) -> Path:
     Returns:
         The path to the created JSON file.
     """
-    if not input_path.exists():
-        raise FileNotFoundError(f"Input file not found: {input_path}")
+    result_path, _ = unpack_msgpack_to_json(input_path, output_path)
+    return result_path
+
+
+def unpack_msgpack_to_json(input_path: Path, output_path: Path | None) -> tuple[Path, Any]:
+    """
+    Reads a MessagePack file, writes its content as a JSON file and returns the decoded data.
+
+    Callers that also display the data can use it directly instead of reading the
+    written JSON back.
+
+    Args:
+        input_path: The path to the source MessagePack file.
+        output_path: The path to the destination JSON file. If None,
+                     it defaults to the input path with a .json extension.
 
+    Returns:
+        The path to the created JSON file and the decoded data.
+    """
     if output_path is None:
         output_path = input_path.with_suffix(".json")
 
-    unpacked_data = msgpack.unpackb(input_path.read_bytes())
-    output_path.write_text(json.dumps(unpacked_data, indent=2), "utf-8")
-    return output_path
+    # Unpacked from the file handle, so the raw file is never held in memory alongside the data;
+    # max_buffer_size=0 lifts the Unpacker's default 100 MiB cap for large states, and
+    # strict_map_key=False accepts the non-string map keys msgpack allows but str-only unpacking rejects
+    try:
+        fin = input_path.open("rb")
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Input file not found: {input_path}") from e
+    with fin:
+        unpacked_data = msgpack.Unpacker(fin, raw=False, strict_map_key=False, max_buffer_size=0).unpack()
+    output_path.write_bytes(fast_json_dumps(unpacked_data, indent=True))
+    return output_path, unpacked_data
 
 
 # 🥣🔬🔚
@@ -11,6 +11,8 @@ from soup.toml into wrknv, making wrkenv.toml optional for TofuSoup users.
 Note: wrknv is an optional dependency. If not installed, matrix testing features
 will be unavailable but other TofuSoup features will work normally."""
 
+import copy
+from functools import lru_cache
 from pathlib import Path
 import tomllib
 from typing import Any
@@ -18,11 +20,20 @@ from typing import Any
 # Optional wrknv import - graceful degradation if not available
 try:
     from wrknv import WorkenvConfig  # type: ignore[import-not-found]
+    from wrknv.env.config import FileConfigSource  # type: ignore[import-not-found]
 
     WORKENV_AVAILABLE = True
 except ImportError:
     WORKENV_AVAILABLE = False
     WorkenvConfig = None
+    FileConfigSource = None
+
+# Project-level config files a WorkenvConfig reads; changes to any of them invalidate the
+# cached config built by create_workenv_config_with_soup
+_WORKENV_CONFIG_FILES = ("soup.toml", "wrkenv.toml", "pyproject.toml")
+
+# Parsed soup.toml files by path, with the (mtime_ns, size) they were parsed at
+_soup_config_cache: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
 
 
 def load_soup_config(project_root: Path | None = None) -> dict[str, Any]:
@@ -34,17 +45,28 @@ def load_soup_config(project_root: Path | None = None) -> dict[str, Any]:
 
     Returns:
         Dictionary containing the soup configuration, or empty dict if not found.
+        The dictionary is shared between calls and must not be modified.
     """
     if project_root is None:
         project_root = Path.cwd()
 
     soup_toml_path = project_root / "soup.toml"
 
-    if soup_toml_path.exists():
-        with soup_toml_path.open("rb") as f:
-            return tomllib.load(f)
+    try:
+        stat = soup_toml_path.stat()
+    except FileNotFoundError:
+        return {}
+
+    # Reuse the parsed file until it changes on disk
+    fingerprint = (stat.st_mtime_ns, stat.st_size)
+    cached = _soup_config_cache.get(soup_toml_path)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
 
-    return {}
+    with soup_toml_path.open("rb") as f:
+        config = tomllib.load(f)
+    _soup_config_cache[soup_toml_path] = (fingerprint, config)
+    return config
 
 
 def create_workenv_config_with_soup(project_root: Path | None = None) -> Any:
@@ -59,6 +81,9 @@ def create_workenv_config_with_soup(project_root: Path | None = None) -> Any:
 
     Returns:
         WorkenvConfig instance with soup.toml configuration injected, or None if workenv not available.
+        Each call returns a shallow copy (with its own ``sources`` list) of a config cached until
+        soup.toml, wrkenv.toml or pyproject.toml in the project root changes. Config sources
+        outside the project root (e.g. user-level files) are not tracked by that cache.
 
     Raises:
         ImportError: If workenv is not installed.
@@ -70,21 +95,48 @@ def create_workenv_config_with_soup(project_root: Path | None = None) -> Any:
             "Install with: uv tool install wrknv (or uv pip install -e /path/to/wrknv)"
         )
 
+    # Rebuild only when a project config file changes (or appears/disappears). The resolved
+    # root is part of the key, so a call without project_root after a chdir never reuses the
+    # config built for the previous working directory.
+    config_root = (project_root or Path.cwd()).resolve()
+    fingerprints = tuple(_file_fingerprint(config_root / name) for name in _WORKENV_CONFIG_FILES)
+    config = copy.copy(_build_workenv_config(project_root, config_root, fingerprints))
+    # Callers get their own sources list, so reordering or adding sources never leaks into the cache
+    config.sources = list(config.sources)
+    return config
+
+
+def _file_fingerprint(path: Path) -> tuple[int, int] | None:
+    """Return a file's (mtime_ns, size), or None if it doesn't exist."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=8)
+def _build_workenv_config(
+    project_root: Path | None,
+    config_root: Path,
+    config_fingerprints: tuple[tuple[int, int] | None, ...],
+) -> Any:
+    """Build the WorkenvConfig for create_workenv_config_with_soup.
+
+    Cached per project root, resolved config root and the (mtime_ns, size) of each file in
+    _WORKENV_CONFIG_FILES, so repeated calls reuse one config until one of them changes.
+    """
+    soup_toml_path = config_root / "soup.toml"
     # Load soup.toml
-    soup_config = load_soup_config(project_root)
+    soup_config = load_soup_config(config_root)
     workenv_section = soup_config.get("workenv", {})
 
     if not workenv_section:
         # No workenv config in soup.toml, just return standard WorkenvConfig
         return WorkenvConfig(project_root=project_root)
 
-    # Create a custom ConfigSource for soup.toml
-    from wrknv.env.config import FileConfigSource  # type: ignore[import-not-found]
-
     # Create a soup.toml source
-    soup_source = FileConfigSource(
-        project_root / "soup.toml" if project_root else Path.cwd() / "soup.toml", "workenv"
-    )
+    soup_source = FileConfigSource(soup_toml_path, "workenv")
 
     # Create WorkenvConfig and add soup source with highest priority
     config = WorkenvConfig(project_root=project_root)
@@ -0,0 +1,59 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+
+from pathlib import Path
+
+from tofusoup.stir.discovery import TestDiscovery, TestFilter
+
+
+def _make_suite(tmp_path: Path) -> None:
+    (tmp_path / "marker_test").mkdir()
+    (tmp_path / "marker_test" / "main.tf").touch()
+    (tmp_path / "soup_dir_test" / ".soup").mkdir(parents=True)
+    (tmp_path / "pattern_test").mkdir()
+    (tmp_path / "pattern_test" / "other.tf").touch()
+    (tmp_path / "empty").mkdir()
+    for excluded in (".git", "venv", ".terraform-cache"):
+        (tmp_path / excluded).mkdir()
+        (tmp_path / excluded / "main.tf").touch()
+
+
+def test_discovers_marker_and_pattern_directories(tmp_path: Path) -> None:
+    _make_suite(tmp_path)
+
+    for recursive in (False, True):
+        discovered = TestDiscovery(recursive=recursive).discover_tests(tmp_path)
+        assert [p.name for p in discovered] == ["marker_test", "pattern_test", "soup_dir_test"]
+
+
+def test_should_exclude_defaults_and_hidden_dirs(tmp_path: Path) -> None:
+    discovery = TestDiscovery(exclude_patterns=["skip_*"])
+
+    for name in (".git", "venv", ".terraform-cache", "terraform.tfstate.backup", "skip_me", ".hidden"):
+        assert discovery._should_exclude(tmp_path / name), name
+    for name in (".soup", ".plating-tests", "keep_me"):
+        assert not discovery._should_exclude(tmp_path / name), name
+
+
+def test_filters_share_compiled_regex() -> None:
+    assert (
+        TestFilter(regex_pattern="resource_.*").regex_pattern
+        is TestFilter(regex_pattern="resource_.*").regex_pattern
+    )
+
+
+def test_tag_filter_negation_wins_regardless_of_order(tmp_path: Path) -> None:
+    test_dir = tmp_path / "basic_slow_suite"
+    test_dir.mkdir()
+
+    assert not TestFilter(tags=["basic", "!slow"]).filter_tests([test_dir])
+    assert not TestFilter(tags=["!slow", "basic"]).filter_tests([test_dir])
+    assert TestFilter(tags=["basic"]).filter_tests([test_dir]) == [test_dir]
+    assert TestFilter(tags=["!fast"]).filter_tests([test_dir]) == [test_dir]
+    assert not TestFilter(tags=["fast"]).filter_tests([test_dir])
+
+
+# 🥣🔬🔚
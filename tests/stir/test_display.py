@@ -0,0 +1,77 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from tofusoup.stir import display
+from tofusoup.stir.display import generate_status_table, test_statuses, update_status
+from tofusoup.stir.executor import initialize_tests
+from tofusoup.stir.models import TestStatus
+
+
+@pytest.fixture(autouse=True)
+def _clean_statuses() -> Iterator[None]:
+    test_statuses.clear()
+    display._sorted_dirs.clear()
+    yield
+    test_statuses.clear()
+    display._sorted_dirs.clear()
+
+
+def _cells(column: int) -> list[str]:
+    return [str(c) for c in generate_status_table().columns[column].cells]
+
+
+def test_status_table_updates_rows_in_place() -> None:
+    initialize_tests([Path("/suite/b_test"), Path("/suite/a_test")])
+    table = generate_status_table()
+    assert [str(c) for c in table.columns[3].cells] == ["[bold]a_test[/bold]", "[bold]b_test[/bold]"]
+    assert display._rows is not None
+    rows = display._rows
+    untouched_row = rows[0]
+
+    update_status("b_test", text="APPLYING", last_log="Creating pyvider_file.x")
+
+    assert _cells(1) == ["💤", "🚀"]
+    # Only the updated row was re-formatted
+    assert display._rows is rows
+    assert rows[0] is untouched_row
+    assert _cells(10) == ["", "Creating pyvider_file.x"]
+
+
+def test_status_table_rebuilds_when_rows_or_columns_change() -> None:
+    initialize_tests([Path("/suite/a_test")])
+    table = generate_status_table()
+
+    assert len(table.columns) == 11
+
+    update_status("a_test", ephemeral_functions=1)
+    assert len(generate_status_table().columns) == 12
+
+    display.set_status("__PROVIDER_PREP__", TestStatus(text="SCANNING", active=True))
+    assert _cells(3)[0] == "[bold magenta]Provider Cache Preparation[/bold magenta]"
+    assert _cells(2) == ["", "[dim]1/1[/dim]"]
+
+    display.remove_status("__PROVIDER_PREP__")
+    assert _cells(3) == ["[bold]a_test[/bold]"]
+
+
+def test_set_phase_applies_preset_and_extra_fields() -> None:
+    initialize_tests([Path("/suite/a_test")])
+    generate_status_table()
+
+    display.set_phase("a_test", "DESTROYING_FAILED", last_log="Destroying...")
+
+    status = test_statuses["a_test"]
+    assert (status.text, status.style, status.active) == ("DESTROYING", "dim red", True)
+    assert status.last_log == "Destroying..."
+    assert _cells(1) == ["💥"]
+
+
+# 🥣🔬🔚
@@ -0,0 +1,36 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+
+import asyncio
+
+from tofusoup.stir.cli import process_results
+from tofusoup.stir.models import StirTestResult
+
+
+def _result(name: str, success: bool = True, skipped: bool = False) -> StirTestResult:
+    return StirTestResult(directory=name, success=success, skipped=skipped, start_time=0.0, end_time=1.0)
+
+
+def test_all_passing_results() -> None:
+    results = [_result("a"), _result("b", skipped=True), _result("c")]
+
+    assert process_results(results) == ([], 1, True)
+
+
+def test_failures_and_critical_errors_fail_the_run() -> None:
+    failed = _result("b", success=False)
+
+    failed_tests, skipped_count, all_passed = process_results([_result("a"), failed])
+    assert (failed_tests, skipped_count, all_passed) == ([failed], 0, False)
+
+    assert process_results([_result("a"), RuntimeError("boom")]) == ([], 0, False)
+
+
+def test_cancelled_tasks_are_not_critical_errors() -> None:
+    assert process_results([_result("a"), asyncio.CancelledError()]) == ([], 0, True)
+
+
+# 🥣🔬🔚
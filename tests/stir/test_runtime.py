@@ -0,0 +1,128 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+
+from pathlib import Path
+
+import pytest
+
+from tofusoup.stir import runtime as stir_runtime
+from tofusoup.stir.runtime import StirRuntime
+
+
+def test_extract_providers_from_required_providers_block(tmp_path: Path) -> None:
+    runtime = StirRuntime(plugin_cache_dir=tmp_path)
+    content = """
+terraform {
+  required_providers {
+    pyvider = { source = "provide-io/pyvider", version = "0.0.1000" }
+  }
+}
+"""
+
+    assert runtime._extract_providers_from_content(content) == {("provide-io/pyvider", "0.0.1000")}
+
+
+def test_find_required_providers_blocks_matches_balanced_braces() -> None:
+    content = (
+        "terraform {\n"
+        '  required_providers {\n    a = { source = "x/a" }\n  }\n'
+        "}\n"
+        "required_providers { b = { nested = { deep = {} } } }\n"
+        "required_providers { unterminated = {"
+    )
+
+    assert stir_runtime._find_required_providers_blocks(content) == [
+        '\n    a = { source = "x/a" }\n  ',
+        " b = { nested = { deep = {} } } ",
+    ]
+
+
+def test_extract_providers_falls_back_to_legacy_syntax(tmp_path: Path) -> None:
+    runtime = StirRuntime(plugin_cache_dir=tmp_path)
+    content = 'provider "aws" {\n  region = "us-east-1"\n}\n'
+
+    assert runtime._extract_providers_from_content(content) == {("hashicorp/aws", ">= 0.0.0")}
+
+
+def test_extract_providers_is_memoized_on_content(tmp_path: Path) -> None:
+    runtime = StirRuntime(plugin_cache_dir=tmp_path)
+    content = 'provider "random" {}\n'
+    stir_runtime._extract_providers_cached.cache_clear()
+
+    first = runtime._extract_providers_from_content(content)
+    second = runtime._extract_providers_from_content(content)
+
+    assert first is second
+    assert stir_runtime._extract_providers_cached.cache_info().hits == 1
+
+
+def test_get_command_env_reuses_base_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    runtime = StirRuntime(plugin_cache_dir=tmp_path)
+    first = runtime.get_command_env(tmp_path / "a" / "tfdata", tmp_path / "a" / "terraform.log")
+    monkeypatch.setenv("STIR_LATE_VAR", "1")
+    second = runtime.get_command_env(tmp_path / "b" / "tfdata", tmp_path / "b" / "terraform.log")
+
+    assert first["TF_LOG"] == "JSON"
+    assert first["TF_PLUGIN_CACHE_DIR"] == str(tmp_path)
+    assert second["TF_DATA_DIR"] == str(tmp_path / "b" / "tfdata")
+    assert second["TF_LOG_PATH"] == str(tmp_path / "b" / "terraform.log")
+    assert "STIR_LATE_VAR" not in second
+
+
+def test_deduplicate_providers_prefers_specific_versions(tmp_path: Path) -> None:
+    runtime = StirRuntime(plugin_cache_dir=tmp_path)
+
+    deduplicated = runtime._deduplicate_providers(
+        {
+            ("hashicorp/aws", ">= 0.0.0"),
+            ("hashicorp/aws", "5.0"),
+            ("hashicorp/null", ">= 3.0"),
+        }
+    )
+
+    assert deduplicated == {("hashicorp/aws", "5.0"), ("hashicorp/null", ">= 3.0")}
+
+
+def test_generate_provider_manifest(tmp_path: Path) -> None:
+    runtime = StirRuntime(plugin_cache_dir=tmp_path)
+
+    manifest = runtime._generate_provider_manifest(
+        {("provide-io/pyvider", "0.0.1000"), ("hashicorp/aws", "5.0")}
+    )
+
+    assert manifest == (
+        "terraform {\n"
+        "  required_providers {\n"
+        "    aws = {\n"
+        '      source  = "hashicorp/aws"\n'
+        '      version = "5.0"\n'
+        "    }\n"
+        "    pyvider-1 = {\n"
+        '      source  = "provide-io/pyvider"\n'
+        '      version = "0.0.1000"\n'
+        "    }\n"
+        "  }\n"
+        "}"
+    )
+
+
+@pytest.mark.asyncio
+async def test_scan_provider_requirements_reads_tf_files_across_dirs(tmp_path: Path) -> None:
+    runtime = StirRuntime(plugin_cache_dir=tmp_path / "cache")
+    for name, provider in (("a_test", "aws"), ("b_test", "null")):
+        test_dir = tmp_path / name
+        test_dir.mkdir()
+        (test_dir / "main.tf").write_text(f'provider "{provider}" {{}}\n')
+        (test_dir / "notes.txt").write_text('provider "ignored" {}\n')
+
+    providers = await runtime._scan_provider_requirements(
+        [tmp_path / "a_test", tmp_path / "b_test", tmp_path / "missing"]
+    )
+
+    assert providers == {("hashicorp/aws", ">= 0.0.0"), ("hashicorp/null", ">= 0.0.0")}
+
+
+# 🥣🔬🔚
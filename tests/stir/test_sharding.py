@@ -0,0 +1,50 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+
+from pathlib import Path
+
+from tofusoup.stir.models import StirTestResult
+from tofusoup.stir.sharding import partition_tests, result_from_dict, result_to_dict, should_shard
+
+
+def test_should_shard_requires_more_than_two_tests_per_shard() -> None:
+    assert not should_shard(100, 1)
+    assert not should_shard(8, 4)
+    assert should_shard(9, 4)
+
+
+def test_partition_tests_is_even_and_complete() -> None:
+    test_dirs = [Path(f"/suite/test_{i:02d}") for i in range(10)]
+
+    partitions = partition_tests(test_dirs, 3)
+
+    assert [len(p) for p in partitions] == [4, 3, 3]
+    assert sorted(d for p in partitions for d in p) == test_dirs
+
+
+def test_result_round_trips_through_json_dict() -> None:
+    result = StirTestResult(
+        directory="test_a",
+        success=False,
+        skipped=False,
+        start_time=1.0,
+        end_time=2.5,
+        tf_log_path=Path("/tmp/terraform.log"),
+        parsed_logs=[{"@level": "error", "@message": "boom"}],
+        resources=3,
+    )
+
+    assert result_from_dict(result_to_dict(result)) == result
+
+
+def test_runner_errors_round_trip_as_runtime_errors() -> None:
+    restored = result_from_dict(result_to_dict(ValueError("bad shard")))
+
+    assert isinstance(restored, RuntimeError)
+    assert "ValueError: bad shard" in str(restored)
+
+
+# 🥣🔬🔚
@@ -0,0 +1,203 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+
+import asyncio
+from collections.abc import Iterator
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from tofusoup.stir import terraform
+from tofusoup.stir.display import test_statuses
+from tofusoup.stir.executor import initialize_tests
+
+
+@pytest.fixture(autouse=True)
+def _clean_state() -> Iterator[None]:
+    initialize_tests([Path("/suite/a_test")])
+    yield
+    test_statuses.clear()
+    terraform._last_update_times.clear()
+    terraform._pending_last_logs.clear()
+
+
+def _line(message: str, level: str = "info") -> str:
+    return json.dumps({"@level": level, "@message": message})
+
+
+def test_last_log_is_debounced_and_final_line_flushed() -> None:
+    terraform._process_log_line(_line("Apply complete! Resources: 1 added").encode(), "a_test")
+    terraform._process_log_line(_line("Apply complete! Resources: 2 added").encode(), "a_test")
+
+    assert test_statuses["a_test"].last_log == "Applied 1 resources"
+
+    terraform._flush_pending_last_log("a_test")
+
+    assert test_statuses["a_test"].last_log == "Applied 2 resources"
+    assert "a_test" not in terraform._pending_last_logs
+
+
+def test_debounced_lines_skip_semantic_extraction(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+    extract = terraform._extract_semantic_message
+
+    def counting_extract(message: str, level: str, **kwargs: str | None) -> str | None:
+        calls.append(message)
+        return extract(message, level, **kwargs)
+
+    monkeypatch.setattr(terraform, "_extract_semantic_message", counting_extract)
+    for added in range(1, 4):
+        terraform._process_log_line(_line(f"Apply complete! Resources: {added} added").encode(), "a_test")
+
+    assert len(calls) == 1
+    terraform._flush_pending_last_log("a_test")
+    assert test_statuses["a_test"].last_log == "Applied 3 resources"
+
+
+def test_flushed_line_keeps_its_error_field_and_module(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[tuple[str, str, dict[str, str | None]]] = []
+
+    def recording_extract(message: str, level: str, **kwargs: str | None) -> str | None:
+        calls.append((message, level, kwargs))
+        return message
+
+    monkeypatch.setattr(terraform, "_extract_semantic_message", recording_extract)
+    for message in ("first", "second"):
+        line = {"@level": "info", "@message": message, "@module": "tofu.ui", "error": "boom"}
+        terraform._process_log_line(json.dumps(line).encode(), "a_test")
+    terraform._flush_pending_last_log("a_test")
+
+    assert calls[-1] == ("second", "info", {"error_field": "boom", "module": "tofu.ui"})
+
+
+@pytest.mark.asyncio
+async def test_process_log_file_handles_partial_lines(tmp_path: Path) -> None:
+    log_path = tmp_path / "terraform.log"
+    warn_line = _line("Provider produced inconsistent result", level="warn")
+    log_path.write_text(f"{_line('Apply complete! Resources: 1 added')}\n{warn_line[:10]}")
+    process = SimpleNamespace(returncode=None)
+
+    task = asyncio.create_task(terraform._process_log_file(log_path, process, "a_test"))  # type: ignore[arg-type]
+    await asyncio.sleep(0.05)
+    assert test_statuses["a_test"].last_log == "Applied 1 resources"
+    assert not test_statuses["a_test"].has_warnings
+
+    with log_path.open("a") as f:
+        f.write(f"{warn_line[10:]}\n")
+    await asyncio.sleep(0.2)
+    with log_path.open("a") as f:
+        f.write(_line("written after the last poll"))
+    process.returncode = 0
+    parsed_logs = await task
+
+    assert test_statuses["a_test"].has_warnings
+    assert [entry["@level"] for entry in parsed_logs] == ["info", "warn", "info"]
+
+
+def test_non_json_lines_are_skipped_before_parsing(monkeypatch: pytest.MonkeyPatch) -> None:
+    parsed: list[bytes] = []
+    monkeypatch.setattr(terraform, "fast_json_loads", lambda line: parsed.append(line) or {})
+    for line in (b"", b"   \r", b'{"@level": "info", "@mess', b"plain text"):
+        terraform._process_log_line(line, "a_test")
+
+    terraform._process_log_line(_line("ok").encode() + b"\r", "a_test")
+
+    assert parsed == [_line("ok").encode()]
+
+
+def test_parse_tf_log_across_chunks(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(terraform, "_LOG_READ_CHUNK_SIZE", 16)
+    log_path = tmp_path / "terraform.log"
+    log_path.write_bytes(
+        f"{_line('first')}\n\nnot json\n{_line('second')}\n".encode() + b"\xff\n" + _line("last").encode()
+    )
+
+    assert [entry["@message"] for entry in terraform._parse_tf_log(log_path)] == ["first", "second", "last"]
+    assert terraform._parse_tf_log(tmp_path / "missing.log") == []
+
+
+def test_invalid_utf8_log_lines_are_kept_with_replacement(tmp_path: Path) -> None:
+    log_path = tmp_path / "terraform.log"
+    bad_line = b'{"@level": "info", "@message": "Initializing \xff modules"}'
+    log_path.write_bytes(bad_line + b"\n" + _line("after").encode())
+
+    assert [entry["@message"] for entry in terraform._parse_tf_log(log_path)] == [
+        "Initializing \ufffd modules",
+        "after",
+    ]
+
+    terraform._process_log_line(bad_line, "a_test")
+    assert test_statuses["a_test"].last_log == "Initializing \ufffd modules"
+
+
+def test_ensure_dir_is_memoized_until_forgotten(tmp_path: Path) -> None:
+    logs_dir = tmp_path / "a_test" / ".soup" / "logs"
+    terraform.ensure_dir(logs_dir)
+    logs_dir.rmdir()
+
+    terraform.ensure_dir(logs_dir)
+    assert not logs_dir.exists()
+
+    terraform.forget_ensured_dirs(tmp_path / "a_test")
+    terraform.ensure_dir(logs_dir)
+    assert logs_dir.is_dir()
+
+
+def test_function_calls_are_counted() -> None:
+    for message in (
+        "GRPCProvider.v6: CallFunction",
+        "GRPCProvider.v6: CallFunction ephemeral",
+        "GRPCProvider.v6: CallFunction",
+    ):
+        terraform._process_log_line(_line(message, level="debug").encode(), "a_test")
+
+    status = test_statuses["a_test"]
+    assert (status.functions, status.ephemeral_functions) == (2, 1)
+
+
+@pytest.mark.parametrize(
+    ("message", "level", "module", "filtered"),
+    [
+        ("Creating pyvider_file.x", "debug", None, True),
+        ("plugin process exited: path=/bin/tofu", "info", None, True),
+        ("Creating Unix socket at /tmp/x", "info", "provider.terraform-provider-pyvider", True),
+        ("Creating Unix socket at /tmp/x", "info", "tofu", False),
+        ("pyvider_file.x: Creating...", "info", None, False),
+    ],
+)
+def test_should_filter_message(message: str, level: str, module: str | None, filtered: bool) -> None:
+    assert terraform._should_filter_message(message, level, module) is filtered
+
+
+def test_trie_regex_matches_each_literal_pattern() -> None:
+    patterns = ("Attempting to acquire", "Attempting to open", "plugin", "plugin exited", "a.b")
+    noise_re = terraform._trie_regex(patterns)
+
+    for pattern in patterns:
+        assert noise_re.search(f"prefix {pattern} suffix")
+    assert not noise_re.search("Attempting to close")
+    assert not noise_re.search("axb")
+
+
+@pytest.mark.parametrize(
+    ("message", "expected"),
+    [
+        ("data.pyvider_env.e: Reading...", "Reading data.pyvider_env.e"),
+        ("Reading data source data.a.b", "Reading data.a.b"),
+        ("registry.opentofu.org/hashicorp/aws v5.0.0 Installing provider", "Installing hashicorp/aws v5.0.0"),
+        ("Installing something", None),
+        ("Apply complete! Resources: 3 added, 0 changed", "Applied 3 resources"),
+        ("Initializing the backend...", "Initializing the backend..."),
+        ("unrelated message", None),
+    ],
+)
+def test_extract_semantic_message(message: str, expected: str | None) -> None:
+    assert terraform._extract_semantic_message(message, "info") == expected
+
+
+# 🥣🔬🔚
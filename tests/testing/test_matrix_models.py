@@ -0,0 +1,33 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+
+import attrs
+import pytest
+
+from tofusoup.testing.matrix import MatrixCombination, MatrixResult
+
+
+def test_matrix_models_are_frozen_and_compare_by_value() -> None:
+    combination = MatrixCombination(tools={"terraform": "1.5.7"})
+    result = MatrixResult(combination=combination, success=True)
+
+    assert combination == MatrixCombination(tools={"terraform": "1.5.7"})
+    assert result == MatrixResult(combination=MatrixCombination(tools={"terraform": "1.5.7"}), success=True)
+    with pytest.raises(attrs.exceptions.FrozenInstanceError):
+        combination.tools = {}  # type: ignore[misc]
+
+
+def test_matrix_models_are_not_hashable() -> None:
+    combination = MatrixCombination(tools={"terraform": "1.5.7"})
+
+    # Their dict fields can't be hashed, so the classes opt out of hashing explicitly
+    assert MatrixCombination.__hash__ is None
+    assert MatrixResult.__hash__ is None
+    with pytest.raises(TypeError, match="unhashable"):
+        hash(combination)
+
+
+# 🥣🔬🔚
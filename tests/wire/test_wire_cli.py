@@ -32,7 +32,7 @@ def test_to_msgpack_command(monkeypatch: MonkeyPatch) -> None:
 def test_to_json_command(monkeypatch: MonkeyPatch) -> None:
     """Verify the to-json CLI command calls the logic layer correctly."""
     mock_convert = MagicMock()
-    monkeypatch.setattr("tofusoup.wire.cli.convert_msgpack_to_json", mock_convert)
+    monkeypatch.setattr("tofusoup.wire.cli.unpack_msgpack_to_json", mock_convert)
 
     runner = CliRunner()
     with runner.isolated_filesystem() as fs:
@@ -40,14 +40,12 @@ def test_to_json_command(monkeypatch: MonkeyPatch) -> None:
         input_file = fs_path / "test.msgpack"
         input_file.write_bytes(msgpack.packb({"valid": "msgpack"}))
 
-        # FIX: The mock must return a Path object that exists *within* the isolated filesystem.
-        output_file_in_fs = fs_path / "output.json"
-        mock_convert.return_value = output_file_in_fs
-        # FIX: The CLI reads this file for pretty-printing, so it must exist.
-        output_file_in_fs.write_text('{"key": "value"}')
+        # The CLI pretty-prints the returned data without reading the output file back
+        mock_convert.return_value = (fs_path / "output.json", {"key": "value"})
 
         result = runner.invoke(to_json, [str(input_file.resolve())])
         assert result.exit_code == 0, result.output
+        assert '"key": "value"' in result.output
         mock_convert.assert_called_once()
 
 
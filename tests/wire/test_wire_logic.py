@@ -0,0 +1,37 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+
+import json
+from pathlib import Path
+
+import msgpack
+
+from tofusoup.wire.logic import convert_json_to_msgpack, unpack_msgpack_to_json
+
+
+def test_json_round_trip_keeps_strings_as_str(tmp_path: Path) -> None:
+    source = tmp_path / "data.json"
+    source.write_text(json.dumps({"name": "tofu", "tags": ["a", "ü"]}), encoding="utf-8")
+
+    packed = convert_json_to_msgpack(source, None)
+    _, data = unpack_msgpack_to_json(packed, tmp_path / "out.json")
+
+    assert data == {"name": "tofu", "tags": ["a", "ü"]}
+    # Strings are packed with the str type, so they never come back as bytes
+    assert msgpack.unpackb(packed.read_bytes(), raw=False) == data
+
+
+def test_unpack_accepts_non_string_map_keys(tmp_path: Path) -> None:
+    source = tmp_path / "data.msgpack"
+    source.write_bytes(msgpack.packb({1: "one"}, use_bin_type=True))
+
+    output_path, data = unpack_msgpack_to_json(source, None)
+
+    assert data == {1: "one"}
+    assert json.loads(output_path.read_text(encoding="utf-8")) == {"1": "one"}
+
+
+# 🥣🔬🔚